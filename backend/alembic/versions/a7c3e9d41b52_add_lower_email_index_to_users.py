@@ -0,0 +1,37 @@
+"""add_lower_email_index_to_users
+
+Revision ID: a7c3e9d41b52
+Revises: f6c47d2e7692
+Create Date: 2026-10-18 10:12:44.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9d41b52'
+down_revision: Union[str, Sequence[str], None] = 'f6c47d2e7692'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a functional index on lower(email) for case-insensitive user lookups.
+
+    Team membership checks on (team_id, user_id) are already covered by the
+    unique constraint on team_members.
+    """
+    op.create_index(
+        'idx_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove the lower(email) index."""
+    op.drop_index('idx_users_email_lower', table_name='users')
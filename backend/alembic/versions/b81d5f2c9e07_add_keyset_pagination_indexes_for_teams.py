@@ -0,0 +1,44 @@
+"""add_keyset_pagination_indexes_for_teams
+
+Revision ID: b81d5f2c9e07
+Revises: a7c3e9d41b52
+Create Date: 2026-10-18 11:40:02.915337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81d5f2c9e07'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9d41b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes matching the keyset pagination sort keys.
+
+    Team lists are ordered by (created_at, id) and team member lists by
+    (joined_at, id) within a team.
+    """
+    op.create_index(
+        'idx_teams_created_id',
+        'teams',
+        ['created_at', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'idx_team_members_team_joined',
+        'team_members',
+        ['team_id', 'joined_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove keyset pagination indexes."""
+    op.drop_index('idx_team_members_team_joined', table_name='team_members')
+    op.drop_index('idx_teams_created_id', table_name='teams')
@@ -0,0 +1,36 @@
+"""add_keyset_pagination_index_for_todos
+
+Revision ID: c4e2a7d9f310
+Revises: b81d5f2c9e07
+Create Date: 2026-10-18 14:05:27.481903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e2a7d9f310'
+down_revision: Union[str, Sequence[str], None] = 'b81d5f2c9e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add an index matching the keyset sort key of assigned todo lists.
+
+    A user's assigned todos are ordered by (created_at, id).
+    """
+    op.create_index(
+        'idx_todos_assigned_created',
+        'todos',
+        ['assigned_to', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove the assigned todos keyset pagination index."""
+    op.drop_index('idx_todos_assigned_created', table_name='todos')
@@ -1,21 +1,26 @@
 """Admin invitation management endpoints."""
+import logging
+from datetime import datetime
 from typing import Optional
-from uuid import UUID
 from fastapi import APIRouter, HTTPException, status, Depends, Query
 from sqlalchemy.orm import Session
 from src.database.base import get_db
 from src.services.invitation_service import InvitationService
-from src.api.middleware.auth import get_current_admin_user
+from src.services.email_service import email_service
+from src.api.middleware.auth import AuthContext, get_current_admin_user
+from src.config import settings
 
 # Import shared router from admin_controller
 from .admin_controller import router
 
+logger = logging.getLogger(__name__)
+
 
 @router.post("/invitations/admin", status_code=status.HTTP_201_CREATED)
 async def create_admin_invitation(
     expires_in_days: Optional[int] = Query(30, ge=1, le=365),
     send_email_to: Optional[str] = Query(None, description="Email address to send invitation to"),
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Create an admin invitation code. Requires admin role.
@@ -23,16 +28,10 @@ async def create_admin_invitation(
     Admin invitations allow users to register with team_leader role
     and automatically create their own team.
     """
-    import logging
-    from src.services.email_service import email_service
-    from src.config import settings
-    
-    logger = logging.getLogger(__name__)
-    
     try:
         invitation = InvitationService.generate_admin_invitation(
             db=db,
-            created_by=UUID(current_user["user_id"]),
+            created_by=current_user.user_id,
             expires_in_days=expires_in_days,
         )
         
@@ -51,7 +50,7 @@ async def create_admin_invitation(
                 invitation_url = f"{frontend_url}/register?code={invitation.code}&email={send_email_to}"
                 
                 # Get inviter name
-                inviter_name = current_user.get("name") or current_user.get("email", "Admin")
+                inviter_name = current_user.email or "Admin"
                 
                 # Build email content for team leader invitation
                 expires_text = f" This invitation expires in {expires_in_days} days." if expires_in_days else ""
@@ -122,7 +121,6 @@ Your invitation code: {invitation.code}
 This is an automated message from InTracker. Please do not reply to this email.
                 """.strip()
                 
-                from datetime import datetime
                 email_sent = email_service.send_email(
                     to_email=send_email_to,
                     subject=subject,
@@ -164,7 +162,7 @@ async def list_invitations(
     used: Optional[bool] = Query(None, description="Filter by used status"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """List all invitations with pagination. Requires admin role."""
@@ -200,7 +198,7 @@ async def list_invitations(
 @router.get("/invitations/{code}", status_code=status.HTTP_200_OK)
 async def get_invitation(
     code: str,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Get invitation by code. Requires admin role."""
@@ -226,7 +224,7 @@ async def get_invitation(
 @router.delete("/invitations/{code}", status_code=status.HTTP_200_OK)
 async def delete_invitation(
     code: str,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Delete an invitation code. Requires admin role."""
@@ -1,6 +1,6 @@
 """Admin migration endpoints."""
 from fastapi import APIRouter, HTTPException, status, Header, Depends, Query
-from src.api.middleware.auth import get_current_admin_user
+from src.api.middleware.auth import AuthContext, get_current_admin_user
 from src.config import settings
 from src.services.migration_service import migration_service
 
@@ -11,7 +11,7 @@ from .admin_controller import router
 @router.post("/migrate")
 async def run_migrations(
     api_key: str = Header(..., alias="X-API-Key"),
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     check_first: bool = Query(True, description="Check if migration is needed before running"),
 ):
     """Run database migrations. Requires admin role or API key.
@@ -19,7 +19,7 @@ async def run_migrations(
     Optimized to only run migrations if needed (unless check_first=False).
     """
     # Check API key (for MCP/admin scripts) OR admin role
-    if api_key != settings.MCP_API_KEY and current_user.get("role") != "admin":
+    if api_key != settings.MCP_API_KEY and current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key or admin access required",
@@ -51,11 +51,11 @@ async def run_migrations(
 @router.get("/migrate/status")
 async def get_migration_status(
     api_key: str = Header(..., alias="X-API-Key"),
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
 ):
     """Get database migration status. Requires admin role or API key."""
     # Check API key (for MCP/admin scripts) OR admin role
-    if api_key != settings.MCP_API_KEY and current_user.get("role") != "admin":
+    if api_key != settings.MCP_API_KEY and current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key or admin access required",
@@ -8,8 +8,10 @@ from sqlalchemy import or_
 from src.database.base import get_db
 from src.database.models import User, TeamMember, Team
 from src.services.auth_service import AuthService
-from src.services.team_service import TeamService
-from src.api.middleware.auth import get_current_admin_user, get_optional_user
+from src.services.team_service import TeamService, ADMIN_TEAMS_TOTAL_CACHE_KEY, invalidate_team_cache
+from src.services.cache_service import CacheService
+from src.services.auth_cache import invalidate_user_auth
+from src.api.middleware.auth import AuthContext, get_current_admin_user, get_optional_user
 from src.config import settings
 
 # Import shared router from admin_controller
@@ -40,8 +42,8 @@ async def create_user(
         pass
     else:
         # No valid API key, check for admin user via JWT
-        current_user = await get_optional_user(credentials, db)
-        if not current_user or current_user.get("role") != "admin":
+        current_user = await get_optional_user(credentials)
+        if not current_user or current_user.role != "admin":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid API key or admin access required",
@@ -147,7 +149,7 @@ async def create_user(
 async def update_user_role(
     user_id: str,
     role: str,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Update a user's role. Requires admin role.
@@ -195,6 +197,8 @@ async def update_user_role(
         user.role = role
         db.commit()
         db.refresh(user)
+        CacheService.invalidate_user_cache(str(user.id))
+        invalidate_user_auth(user.id)
 
         return {
             "message": f"User role updated from {old_role} to {role}",
@@ -220,7 +224,7 @@ async def update_user_role(
 async def update_user_role_by_email(
     email: str,
     role: str,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Update a user's role by email. Requires admin role."""
@@ -245,6 +249,8 @@ async def update_user_role_by_email(
         user.role = role
         db.commit()
         db.refresh(user)
+        CacheService.invalidate_user_cache(str(user.id))
+        invalidate_user_auth(user.id)
 
         return {
             "message": f"User role updated from {old_role} to {role}",
@@ -272,7 +278,7 @@ async def list_users(
     search: Optional[str] = Query(None, description="Search by email or name"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """List all users with pagination. Requires admin role."""
@@ -324,7 +330,7 @@ async def list_users(
 @router.get("/users/{user_id}", status_code=status.HTTP_200_OK)
 async def get_user(
     user_id: str,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Get user by ID. Requires admin role."""
@@ -363,7 +369,7 @@ async def update_user(
     name: Optional[str] = None,
     email: Optional[str] = None,
     is_active: Optional[bool] = None,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Update user. Requires admin role."""
@@ -392,6 +398,8 @@ async def update_user(
 
         db.commit()
         db.refresh(user)
+        if is_active is not None:
+            invalidate_user_auth(user.id)
 
         return {
             "message": "User updated successfully",
@@ -417,7 +425,7 @@ async def update_user(
 @router.delete("/users/{user_id}", status_code=status.HTTP_200_OK)
 async def delete_user_by_id(
     user_id: str,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Delete user by ID. Requires admin role."""
@@ -430,7 +438,7 @@ async def delete_user_by_id(
             )
 
         # Prevent deleting yourself
-        if str(user.id) == current_user["user_id"]:
+        if user.id == current_user.user_id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="You cannot delete your own account",
@@ -463,6 +471,7 @@ async def delete_user_by_id(
         # For now, we'll delete teams created by this user
         from src.database.models import Team, InvitationCode
         teams_created_by_user = db.query(Team).filter(Team.created_by == user.id).all()
+        deleted_team_ids = [team.id for team in teams_created_by_user]
         for team in teams_created_by_user:
             db.delete(team)
         
@@ -478,8 +487,14 @@ async def delete_user_by_id(
             invitation_code.used_by = None
 
         user_email = user.email
+        deleted_user_id = user.id
         db.delete(user)
         db.commit()
+        invalidate_user_auth(deleted_user_id)
+        for team_id in deleted_team_ids:
+            invalidate_team_cache(team_id)
+        if deleted_team_ids:
+            CacheService.delete_cache(ADMIN_TEAMS_TOTAL_CACHE_KEY)
 
         return {
             "message": f"User {user_email} deleted successfully",
@@ -10,7 +10,7 @@ from src.database.models import (
     Project, Feature, Todo, ProjectElement, Document, Session as SessionModel, Idea,
     User
 )
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/audit", tags=["audit"])
 async def get_entity_audit_trail(
     entity_type: str,
     entity_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get audit trail for a specific entity.
@@ -91,7 +91,7 @@ async def get_user_created_entities(
     user_id: UUID,
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
     limit: int = Query(50, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all entities created by a specific user.
@@ -171,7 +171,7 @@ async def get_user_updated_entities(
     user_id: UUID,
     entity_type: Optional[str] = Query(None, description="Filter by entity type"),
     limit: int = Query(50, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all entities updated by a specific user.
@@ -17,7 +17,7 @@ from src.api.schemas.auth import (
     UserResponse,
     AuthResponse,
 )
-from src.api.middleware.auth import get_current_user, get_optional_user
+from src.api.middleware.auth import AuthContext, get_current_user, get_optional_user
 from src.services.github_token_service import github_token_service
 from src.services.onboarding_service import update_setup_completed
 from src.utils.password_validator import PasswordValidator
@@ -125,7 +125,7 @@ async def refresh(request: RefreshTokenRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/logout")
-async def logout(current_user: dict = Depends(get_current_user)):
+async def logout(current_user: AuthContext = Depends(get_current_user)):
     """Logout user.
     
     Note: Since JWT tokens are stateless, we don't invalidate them server-side.
@@ -135,9 +135,9 @@ async def logout(current_user: dict = Depends(get_current_user)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)):
+async def get_me(current_user: AuthContext = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get current user info."""
-    user = db.query(User).filter(User.id == current_user["user_id"]).first()
+    user = db.query(User).filter(User.id == current_user.user_id).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -145,12 +145,12 @@ async def get_me(current_user: dict = Depends(get_current_user), db: Session = D
         )
 
     # Update setup_completed status (always check on /auth/me call)
-    update_setup_completed(db, UUID(current_user["user_id"]))
+    update_setup_completed(db, current_user.user_id)
     
     # Re-query user to get updated setup_completed and onboarding_step
     # This ensures we get the latest values from the database
     # Use merge=False to get a fresh instance from the database
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
@@ -176,7 +176,7 @@ async def get_me(current_user: dict = Depends(get_current_user), db: Session = D
 
 @router.get("/github/authorize")
 async def github_authorize(
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     state: Optional[str] = Query(None),
     redirect_path: str = Query("/settings", description="Frontend path for OAuth callback"),
 ):
@@ -189,7 +189,7 @@ async def github_authorize(
         redirect_path: Frontend path for OAuth callback (default: /settings, can be /onboarding)
     """
     try:
-        user_id = UUID(current_user["user_id"])
+        user_id = current_user.user_id
         
         # Ensure redirect_path starts with /
         if not redirect_path.startswith("/"):
@@ -246,7 +246,7 @@ async def github_callback(
     code: str = Query(...),
     state: str = Query(...),
     db: Session = Depends(get_db),
-    current_user: Optional[dict] = Depends(get_optional_user),
+    current_user: Optional[AuthContext] = Depends(get_optional_user),
 ):
     """Handle GitHub OAuth callback and store tokens.
     
@@ -260,7 +260,7 @@ async def github_callback(
         # Try to get user_id from authenticated user first
         user_id = None
         if current_user:
-            user_id = UUID(current_user["user_id"])
+            user_id = current_user.user_id
         else:
             # If no authenticated user, try to get user_id from state in Redis
             # The state should have been stored with user_id during authorization
@@ -398,12 +398,12 @@ async def github_callback(
 
 @router.post("/github/disconnect")
 async def github_disconnect(
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Disconnect GitHub account by clearing tokens."""
     try:
-        user_id = UUID(current_user["user_id"])
+        user_id = current_user.user_id
         user = db.query(User).filter(User.id == user_id).first()
         if not user:
             raise HTTPException(
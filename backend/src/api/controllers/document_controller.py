@@ -4,10 +4,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.document_service import document_service
 from src.services.project_service import project_service
 from src.services.signalr_hub import broadcast_project_update
+from src.api.utils.json_response import validated_json_response
 from src.api.schemas.document import (
     DocumentCreate,
     DocumentUpdate,
@@ -21,15 +22,15 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 @router.post("", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def create_document(
     document_data: DocumentCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new document."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=document_data.project_id,
         required_role="editor",
     ):
@@ -38,7 +39,7 @@ async def create_document(
             detail="You don't have permission to create documents in this project",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     document = document_service.create_document(
         db=db,
         project_id=document_data.project_id,
@@ -76,14 +77,14 @@ async def list_project_documents(
     search: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List documents for a project."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -103,18 +104,18 @@ async def list_project_documents(
         limit=page_size,
     )
 
-    return DocumentListResponse(
-        documents=documents,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return validated_json_response(DocumentListResponse, {
+        "documents": documents,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get document by ID."""
@@ -128,7 +129,7 @@ async def get_document(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=document.project_id,
     ):
         raise HTTPException(
@@ -142,7 +143,7 @@ async def get_document(
 @router.get("/{document_id}/content")
 async def get_document_content(
     document_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get document content (markdown)."""
@@ -156,7 +157,7 @@ async def get_document_content(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=document.project_id,
     ):
         raise HTTPException(
@@ -177,8 +178,8 @@ async def get_document_content(
 async def update_document(
     document_id: UUID,
     document_data: DocumentUpdate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update document."""
@@ -192,7 +193,7 @@ async def update_document(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=document.project_id,
         required_role="editor",
     ):
@@ -201,7 +202,7 @@ async def update_document(
             detail="You don't have permission to edit this document",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     updated_document = document_service.update_document(
         db=db,
         document_id=document_id,
@@ -241,8 +242,8 @@ async def update_document(
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
     document_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete document."""
@@ -256,7 +257,7 @@ async def delete_document(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=document.project_id,
         required_role="editor",
     ):
@@ -2,9 +2,10 @@
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.element_service import element_service
 from src.services.project_service import project_service
 from src.services.signalr_hub import broadcast_project_update
@@ -24,15 +25,15 @@ router = APIRouter(prefix="/elements", tags=["elements"])
 @router.post("", response_model=ElementResponse, status_code=status.HTTP_201_CREATED)
 async def create_element(
     element_data: ElementCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new element."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element_data.project_id,
         required_role="editor",
     ):
@@ -41,7 +42,7 @@ async def create_element(
             detail="You don't have permission to create elements in this project",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     try:
         element = element_service.create_element(
             db=db,
@@ -79,14 +80,14 @@ async def create_element(
 @router.get("/project/{project_id}/tree")
 async def get_project_elements_tree(
     project_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get project elements as a tree structure."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -95,13 +96,14 @@ async def get_project_elements_tree(
         )
 
     tree = element_service.build_element_tree(db=db, project_id=project_id)
-    return {"project_id": str(project_id), "elements": tree}
+    # The tree is already plain dicts of strings and ints; skip jsonable_encoder's deep walk
+    return ORJSONResponse({"project_id": str(project_id), "elements": tree})
 
 
 @router.get("/{element_id}", response_model=ElementWithTodosResponse)
 async def get_element(
     element_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get element with todos and dependencies."""
@@ -117,7 +119,7 @@ async def get_element(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element.project_id,
     ):
         raise HTTPException(
@@ -163,8 +165,8 @@ async def get_element(
 async def update_element(
     element_id: UUID,
     element_data: ElementUpdate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update element."""
@@ -178,7 +180,7 @@ async def update_element(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element.project_id,
         required_role="editor",
     ):
@@ -187,7 +189,7 @@ async def update_element(
             detail="You don't have permission to edit this element",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     try:
         updated_element = element_service.update_element(
             db=db,
@@ -240,8 +242,8 @@ async def update_element(
 @router.delete("/{element_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_element(
     element_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete element."""
@@ -255,7 +257,7 @@ async def delete_element(
     # Check project access (owner only)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element.project_id,
         required_role="owner",
     ):
@@ -289,8 +291,8 @@ async def delete_element(
 async def add_dependency(
     element_id: UUID,
     dependency_data: DependencyCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Add dependency to an element."""
@@ -304,7 +306,7 @@ async def add_dependency(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element.project_id,
         required_role="editor",
     ):
@@ -343,7 +345,7 @@ async def add_dependency(
 @router.get("/{element_id}/dependencies")
 async def get_element_dependencies(
     element_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get dependencies for an element."""
@@ -357,7 +359,7 @@ async def get_element_dependencies(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element.project_id,
     ):
         raise HTTPException(
@@ -373,8 +375,8 @@ async def get_element_dependencies(
 async def remove_dependency(
     element_id: UUID,
     depends_on_element_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Remove dependency."""
@@ -388,7 +390,7 @@ async def remove_dependency(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=element.project_id,
         required_role="editor",
     ):
@@ -4,10 +4,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.feature_service import feature_service
 from src.services.project_service import project_service
 from src.services.signalr_hub import broadcast_feature_update
+from src.api.utils.json_response import validated_json_response
 from src.api.schemas.feature import (
     FeatureCreate,
     FeatureUpdate,
@@ -21,15 +22,15 @@ router = APIRouter(prefix="/features", tags=["features"])
 @router.post("", response_model=FeatureResponse, status_code=status.HTTP_201_CREATED)
 async def create_feature(
     feature_data: FeatureCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new feature."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature_data.project_id,
         required_role="editor",
     ):
@@ -38,7 +39,7 @@ async def create_feature(
             detail="You don't have permission to create features in this project",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     feature = feature_service.create_feature(
         db=db,
         project_id=feature_data.project_id,
@@ -70,14 +71,14 @@ async def list_features(
     sort: Optional[str] = Query("updated_at_desc", description="Sort order: updated_at_desc (default), updated_at_asc, created_at_desc, created_at_asc, name_asc, name_desc"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List features for a project with pagination. Default sort: updated_at DESC (newest first)."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -95,18 +96,18 @@ async def list_features(
         limit=page_size,
     )
 
-    return FeatureListResponse(
-        features=features,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return validated_json_response(FeatureListResponse, {
+        "features": features,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get("/{feature_id}", response_model=FeatureResponse)
 async def get_feature(
     feature_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get feature by ID."""
@@ -120,7 +121,7 @@ async def get_feature(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
     ):
         raise HTTPException(
@@ -135,8 +136,8 @@ async def get_feature(
 async def update_feature(
     feature_id: UUID,
     feature_data: FeatureUpdate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update feature."""
@@ -150,7 +151,7 @@ async def update_feature(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
         required_role="editor",
     ):
@@ -159,7 +160,7 @@ async def update_feature(
             detail="You don't have permission to edit this feature",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     updated_feature = feature_service.update_feature(
         db=db,
         feature_id=feature_id,
@@ -186,8 +187,8 @@ async def update_feature(
 @router.delete("/{feature_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_feature(
     feature_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete feature."""
@@ -201,7 +202,7 @@ async def delete_feature(
     # Check project access (owner only)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
         required_role="owner",
     ):
@@ -237,7 +238,7 @@ async def get_feature_todos(
     status_filter: Optional[str] = Query(None, alias="status"),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get todos for a feature with pagination."""
@@ -251,7 +252,7 @@ async def get_feature_todos(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
     ):
         raise HTTPException(
@@ -284,7 +285,7 @@ async def get_feature_elements(
     feature_id: UUID,
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get elements linked to a feature with pagination."""
@@ -298,7 +299,7 @@ async def get_feature_elements(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
     ):
         raise HTTPException(
@@ -326,8 +327,8 @@ async def get_feature_elements(
 async def link_element_to_feature(
     feature_id: UUID,
     element_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Link an element to a feature."""
@@ -341,7 +342,7 @@ async def link_element_to_feature(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
         required_role="editor",
     ):
@@ -380,8 +381,8 @@ async def link_element_to_feature(
 @router.post("/{feature_id}/calculate-progress")
 async def calculate_feature_progress(
     feature_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Calculate and update feature progress."""
@@ -395,7 +396,7 @@ async def calculate_feature_progress(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
     ):
         raise HTTPException(
@@ -3,7 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.project_service import project_service
 from src.services.github_service import github_service
 from src.services.branch_service import branch_service
@@ -22,14 +22,14 @@ router = APIRouter(prefix="/github", tags=["github"])
 async def connect_github_repo(
     project_id: UUID,
     connect_data: GitHubConnectRequest,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Connect a GitHub repository to a project."""
     # Check project access (owner only)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
         required_role="owner",
     ):
@@ -73,14 +73,14 @@ async def connect_github_repo(
 @router.get("/projects/{project_id}/repo", response_model=GitHubRepoResponse)
 async def get_github_repo(
     project_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get GitHub repository information for a project."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -115,7 +115,7 @@ async def get_github_repo(
 
 @router.get("/projects/access")
 async def get_projects_access(
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get list of projects with GitHub OAuth token access validation.
@@ -127,7 +127,7 @@ async def get_projects_access(
     NOTE: This endpoint must be defined BEFORE /projects/{project_id}/branches
     to avoid path parameter conflicts.
     """
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     accessible_projects = github_access_service.validate_project_access_for_user(
         db=db,
@@ -142,14 +142,14 @@ async def list_project_branches(
     project_id: UUID,
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List branches for a project with pagination."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -186,7 +186,7 @@ async def list_project_branches(
 @router.post("/branches", status_code=status.HTTP_201_CREATED)
 async def create_branch(
     branch_data: BranchCreateRequest,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a branch for a feature."""
@@ -202,7 +202,7 @@ async def create_branch(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
         required_role="editor",
     ):
@@ -243,7 +243,7 @@ async def create_branch(
 @router.get("/branches/{branch_id}")
 async def get_branch(
     branch_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get branch details."""
@@ -257,7 +257,7 @@ async def get_branch(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=branch.project_id,
     ):
         raise HTTPException(
@@ -290,7 +290,7 @@ async def get_branch(
 @router.get("/features/{feature_id}/branches")
 async def get_feature_branches(
     feature_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get branches for a feature."""
@@ -305,7 +305,7 @@ async def get_feature_branches(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=feature.project_id,
     ):
         raise HTTPException(
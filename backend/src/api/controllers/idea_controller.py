@@ -4,10 +4,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.idea_service import IdeaService
 from src.services.team_service import TeamService
 from src.services.signalr_hub import broadcast_idea_update, broadcast_project_update
+from src.api.utils.json_response import validated_json_response
 from src.api.schemas.idea import (
     IdeaCreate,
     IdeaUpdate,
@@ -25,13 +26,13 @@ idea_service = IdeaService()
 @router.post("", response_model=IdeaResponse, status_code=status.HTTP_201_CREATED)
 async def create_idea(
     idea_data: IdeaCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new idea for a team."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     team_id = idea_data.team_id
     
     # Verify team exists
@@ -49,7 +50,7 @@ async def create_idea(
             detail="You are not a member of this team",
         )
     
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     idea = idea_service.create_idea(
         db=db,
         team_id=team_id,
@@ -81,15 +82,15 @@ async def list_ideas(
     team_id: Optional[UUID] = Query(None, description="Filter by team ID"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List ideas accessible to the user (from teams where user is a member)."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     # If team_id is provided, verify user has access to that team
     if team_id:
-        user_role = current_user.get("role")
+        user_role = current_user.role
         if user_role != "admin" and not TeamService.is_team_member(db, team_id, user_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -106,18 +107,23 @@ async def list_ideas(
         limit=page_size,
     )
 
-    return IdeaListResponse(ideas=ideas, total=total, page=page, page_size=page_size)
+    return validated_json_response(IdeaListResponse, {
+        "ideas": ideas,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get("/{idea_id}", response_model=IdeaResponse)
 async def get_idea(
     idea_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get idea by ID. User must be a member of the team that owns the idea."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     
     idea = idea_service.get_idea_by_id(db=db, idea_id=idea_id)
     if not idea:
@@ -140,13 +146,13 @@ async def get_idea(
 async def update_idea(
     idea_id: UUID,
     idea_data: IdeaUpdate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update idea. User must be a team leader or admin."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     
     idea = idea_service.get_idea_by_id(db=db, idea_id=idea_id)
     if not idea:
@@ -162,7 +168,7 @@ async def update_idea(
             detail="Only team leaders can edit ideas",
         )
     
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     idea = idea_service.update_idea(
         db=db,
         idea_id=idea_id,
@@ -198,13 +204,13 @@ async def update_idea(
 @router.delete("/{idea_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_idea(
     idea_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete idea. User must be a team leader or admin."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     
     idea = idea_service.get_idea_by_id(db=db, idea_id=idea_id)
     if not idea:
@@ -245,13 +251,13 @@ async def delete_idea(
 async def convert_idea_to_project(
     idea_id: UUID,
     convert_data: IdeaConvertRequest,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Convert idea to project. User must be a team leader or admin."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     
     idea = idea_service.get_idea_by_id(db=db, idea_id=idea_id)
     if not idea:
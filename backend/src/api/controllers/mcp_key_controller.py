@@ -4,7 +4,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.mcp_key_service import mcp_key_service
 from src.services.onboarding_service import update_setup_completed
 from src.api.schemas.mcp_key import (
@@ -19,14 +19,14 @@ router = APIRouter(prefix="/mcp-keys", tags=["mcp-keys"])
 
 @router.get("/current", response_model=McpApiKeyResponse)
 async def get_current_mcp_key(
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get the current active MCP API key for the current user.
     
     Returns the key metadata (without the plain text key, which cannot be retrieved).
     """
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     api_key = mcp_key_service.get_current_key(db=db, user_id=user_id)
     
@@ -51,7 +51,7 @@ async def get_current_mcp_key(
 @router.post("/regenerate", response_model=McpApiKeyCreateResponse, status_code=status.HTTP_201_CREATED)
 async def regenerate_mcp_key(
     key_data: McpApiKeyCreate,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Regenerate (create new) MCP API key for the current user.
@@ -60,7 +60,7 @@ async def regenerate_mcp_key(
     The plain_text_key is returned only once and should be shown to the user.
     It cannot be retrieved again after creation.
     """
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     api_key, plain_text_key = mcp_key_service.create_key(
         db=db,
@@ -98,7 +98,7 @@ async def regenerate_mcp_key(
 @router.post("", response_model=McpApiKeyCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_mcp_key(
     key_data: McpApiKeyCreate,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new MCP API key for the current user.
@@ -107,7 +107,7 @@ async def create_mcp_key(
     The plain_text_key is returned only once and should be shown to the user.
     It cannot be retrieved again after creation.
     """
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     api_key, plain_text_key = mcp_key_service.create_key(
         db=db,
@@ -147,11 +147,11 @@ async def list_mcp_keys(
     include_inactive: bool = False,
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List MCP API keys for the current user with pagination."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     skip = (page - 1) * page_size
     keys, total = mcp_key_service.get_keys_by_user(
@@ -185,11 +185,11 @@ async def list_mcp_keys(
 @router.get("/{key_id}", response_model=McpApiKeyResponse)
 async def get_mcp_key(
     key_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get a specific MCP API key by ID."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     api_key = mcp_key_service.get_key_by_id(db=db, key_id=key_id, user_id=user_id)
     
@@ -214,11 +214,11 @@ async def get_mcp_key(
 @router.post("/{key_id}/revoke", status_code=status.HTTP_204_NO_CONTENT)
 async def revoke_mcp_key(
     key_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Revoke (deactivate) an MCP API key."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     success = mcp_key_service.revoke_key(db=db, key_id=key_id, user_id=user_id)
     
@@ -232,11 +232,11 @@ async def revoke_mcp_key(
 @router.delete("/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mcp_key(
     key_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete an MCP API key permanently."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     success = mcp_key_service.delete_key(db=db, key_id=key_id, user_id=user_id)
     
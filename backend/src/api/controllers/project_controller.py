@@ -4,10 +4,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.project_service import project_service
 from src.services.team_service import TeamService
 from src.services.signalr_hub import broadcast_project_update
+from src.api.utils.json_response import validated_json_response
 from src.api.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
@@ -21,13 +22,13 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new project for a team."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     team_id = project_data.team_id
     
     # Verify team exists
@@ -80,15 +81,15 @@ async def list_projects(
     team_id: Optional[UUID] = Query(None, description="Filter by team ID"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List projects accessible to the user (from teams where user is a member)."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     
     # If team_id is provided, verify user has access to that team
     if team_id:
-        user_role = current_user.get("role")
+        user_role = current_user.role
         if user_role != "admin" and not TeamService.is_team_member(db, team_id, user_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -105,18 +106,18 @@ async def list_projects(
         limit=page_size,
     )
 
-    return ProjectListResponse(
-        projects=projects,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return validated_json_response(ProjectListResponse, {
+        "projects": projects,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get("/{project_id}/active-users")
 async def get_active_users(
     project_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get active users for a project (users with open MCP sessions on project todos).
@@ -129,7 +130,7 @@ async def get_active_users(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -144,14 +145,14 @@ async def get_active_users(
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get project by ID."""
     # Check access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -173,14 +174,14 @@ async def get_project(
 async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update project."""
     # Check access (team leader or admin)
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     
     if user_role != "admin":
         project = project_service.get_project_by_id(db, project_id)
@@ -267,14 +268,14 @@ async def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete project (owner only)."""
     # Check access (team leader or admin only)
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
     
     if user_role != "admin":
         project = project_service.get_project_by_id(db, project_id)
@@ -311,7 +312,7 @@ async def delete_project(
 @router.get("/{project_id}/active-users")
 async def get_active_users(
     project_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get active users for a project (users with open MCP sessions on project todos).
@@ -324,7 +325,7 @@ async def get_active_users(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
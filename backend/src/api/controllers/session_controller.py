@@ -4,10 +4,11 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.services.session_service import session_service
 from src.services.project_service import project_service
 from src.services.signalr_hub import broadcast_session_start, broadcast_session_end
+from src.api.utils.json_response import validated_json_response
 from src.api.schemas.session import (
     SessionCreate,
     SessionUpdate,
@@ -22,15 +23,15 @@ router = APIRouter(prefix="/sessions", tags=["sessions"])
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_session(
     session_data: SessionCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Start a new session."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=session_data.project_id,
     ):
         raise HTTPException(
@@ -38,7 +39,7 @@ async def create_session(
             detail="You don't have access to this project",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     session = session_service.create_session(
         db=db,
         project_id=session_data.project_id,
@@ -53,7 +54,7 @@ async def create_session(
     background_tasks.add_task(
         broadcast_session_start,
         str(session_data.project_id),
-        str(current_user["user_id"])
+        str(current_user.user_id)
     )
     
     return session
@@ -65,14 +66,14 @@ async def list_project_sessions(
     user_id: Optional[UUID] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List sessions for a project."""
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=project_id,
     ):
         raise HTTPException(
@@ -89,18 +90,18 @@ async def list_project_sessions(
         limit=page_size,
     )
 
-    return SessionListResponse(
-        sessions=sessions,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    return validated_json_response(SessionListResponse, {
+        "sessions": sessions,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get session by ID."""
@@ -114,7 +115,7 @@ async def get_session(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=session.project_id,
     ):
         raise HTTPException(
@@ -129,8 +130,8 @@ async def get_session(
 async def update_session(
     session_id: UUID,
     session_data: SessionUpdate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update session."""
@@ -144,7 +145,7 @@ async def update_session(
     # Check project access (editor or owner)
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=session.project_id,
         required_role="editor",
     ):
@@ -153,7 +154,7 @@ async def update_session(
             detail="You don't have permission to edit this session",
         )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     updated_session = session_service.update_session(
         db=db,
         session_id=session_id,
@@ -183,8 +184,8 @@ async def update_session(
 async def end_session(
     session_id: UUID,
     end_data: EndSessionRequest,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """End session and generate summary."""
@@ -198,7 +199,7 @@ async def end_session(
     # Check project access
     if not project_service.check_user_access(
         db=db,
-        user_id=UUID(current_user["user_id"]),
+        user_id=current_user.user_id,
         project_id=session.project_id,
     ):
         raise HTTPException(
@@ -227,7 +228,7 @@ async def end_session(
         background_tasks.add_task(
             broadcast_session_end,
             str(session.project_id),
-            str(current_user["user_id"])
+            str(current_user.user_id)
         )
 
         return ended_session
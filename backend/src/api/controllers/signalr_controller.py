@@ -1,15 +1,19 @@
 """SignalR WebSocket hub controller."""
+import re
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, HTTPException, Depends
 from typing import Optional
-from uuid import UUID
 from src.services.signalr_hub import handle_websocket, connection_manager
-from src.api.middleware.auth import get_current_user
+from src.api.middleware.auth import AuthContext, get_current_user
 from src.database.base import get_db
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
-from src.database.models import User
+from src.database.models import Project, User
 
 router = APIRouter(prefix="/signalr", tags=["signalr"])
 
+# Canonical UUID format check, avoids exception-based validation on the happy path
+_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+
 
 @router.websocket("/hub")
 async def websocket_hub(
@@ -50,23 +54,29 @@ async def negotiate():
 @router.get("/hub/projects/{project_id}/active-users")
 async def get_active_users(
     project_id: str,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Get list of active users for a project.
     Returns user information for all users currently connected to the project.
     """
-    try:
-        project_uuid = UUID(project_id)
-    except ValueError:
+    if not _UUID_RE.fullmatch(project_id):
         raise HTTPException(status_code=400, detail="Invalid project ID")
     
-    # Get active user IDs from connection manager
+    # Get active user IDs from connection manager (a set of UUIDs, so no duplicates)
     active_user_ids = connection_manager.get_active_users_for_project(project_id)
     
-    # Fetch user details from database
-    users = db.query(User).filter(User.id.in_(active_user_ids)).all()
+    # Idle project - nothing to look up
+    if not active_user_ids:
+        return {"projectId": project_id, "activeUsers": [], "count": 0}
+    
+    # Fetch user details and check the project exists in the same round trip
+    project_exists = exists().where(Project.id == project_id).label("project_exists")
+    rows = db.query(User, project_exists).filter(User.id.in_(active_user_ids)).all()
+    if rows and not rows[0].project_exists:
+        raise HTTPException(status_code=404, detail="Project not found")
+    users = [row.User for row in rows]
     
     return {
         "projectId": project_id,
@@ -5,11 +5,16 @@ The actual endpoints are defined in:
 - team_crud: Team CRUD operations (create, list, get, update, delete)
 - team_members: Team member management (get, add, remove, update role)
 - team_settings: Team settings (language, invitations)
+
+Team endpoints are plain ``def`` functions: they only make blocking SQLAlchemy
+Session calls, so FastAPI runs them in its threadpool instead of on the event loop.
 """
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 # Create shared router for all team endpoints
-router = APIRouter(prefix="/teams", tags=["teams"])
+# UUIDs and datetimes in team payloads are encoded natively by orjson
+router = APIRouter(prefix="/teams", tags=["teams"], default_response_class=ORJSONResponse)
 
 # Import all team modules to register their routes
 # Note: Import order matters - import after router creation to avoid circular imports
@@ -1,10 +1,13 @@
 """Team CRUD endpoints."""
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from src.database.base import get_db
 from src.services.team_service import TeamService
-from src.api.middleware.auth import get_current_user, get_current_team_leader, get_current_admin_user
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.api.middleware.auth import AuthContext, get_current_user, get_current_team_leader, get_current_admin_user
 from src.api.schemas.team import (
     TeamCreateRequest,
     TeamUpdateRequest,
@@ -18,35 +21,28 @@ from .team_controller import router  # noqa: E402
 
 
 @router.post("", response_model=TeamResponse, status_code=status.HTTP_201_CREATED)
-async def create_team(
+def create_team(
     request: TeamCreateRequest,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Create a new team. Only admins can create teams."""
-    if current_user.get("role") != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only admins can create teams",
-        )
-
     try:
         team = TeamService.create_team(
             db=db,
             name=request.name,
-            created_by=UUID(current_user["user_id"]),
+            created_by=current_user.user_id,
             description=request.description,
         )
-        # Convert UUIDs to strings for response
-        return {
-            "id": str(team.id),
-            "name": team.name,
-            "description": team.description,
-            "language": team.language,
-            "created_by": str(team.created_by),
-            "created_at": team.created_at,
-            "updated_at": team.updated_at,
-        }
+        return TeamResponse.model_construct(
+            id=team.id,
+            name=team.name,
+            description=team.description,
+            language=team.language,
+            created_by=team.created_by,
+            created_at=team.created_at,
+            updated_at=team.updated_at,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -55,95 +51,119 @@ async def create_team(
 
 
 @router.get("", response_model=TeamListResponse)
-async def list_teams(
-    current_user: dict = Depends(get_current_user),
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+def list_teams(
+    current_user: AuthContext = Depends(get_current_user),
+    page: int = Query(1, ge=1, description="Page number (1-indexed). Deprecated: use cursor", deprecated=True),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
     db: Session = Depends(get_db),
 ):
     """List teams with pagination. Returns user's teams or all teams if admin."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     skip = (page - 1) * page_size
-    # Admins can see all teams, others only their teams
-    if user_role == "admin":
-        teams, total = TeamService.list_teams(db, user_id=None, skip=skip, limit=page_size)
-    else:
-        teams, total = TeamService.list_teams(db, user_id=user_id, skip=skip, limit=page_size)
-
-    # Convert UUIDs to strings for response
-    teams_data = [
-        {
-            "id": str(team.id),
-            "name": team.name,
-            "description": team.description,
-            "language": team.language,
-            "created_by": str(team.created_by),
-            "created_at": team.created_at,
-            "updated_at": team.updated_at,
-        }
-        for team in teams
-    ]
-    return TeamListResponse(teams=teams_data, total=total, page=page, page_size=page_size)
+    # Admins can see all teams, others only their teams. One extra row tells
+    # whether another page exists.
+    teams, total = TeamService.list_teams(
+        db,
+        user_id=None if user_role == "admin" else user_id,
+        skip=skip,
+        limit=page_size + 1,
+        after=after,
+    )
+
+    next_cursor = None
+    if len(teams) > page_size:
+        teams = teams[:page_size]
+        next_cursor = encode_cursor(teams[-1].created_at, teams[-1].id)
+
+    # Hot path: rows come straight from the database, so encode them with orjson
+    # directly instead of validating through TeamListResponse (kept for the schema)
+    return ORJSONResponse({
+        "teams": [
+            {
+                "id": team.id,
+                "name": team.name,
+                "description": team.description,
+                "language": team.language,
+                "created_by": team.created_by,
+                "created_at": team.created_at,
+                "updated_at": team.updated_at,
+            }
+            for team in teams
+        ],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    })
 
 
 @router.get("/{team_id}", response_model=TeamResponse)
-async def get_team(
+def get_team(
     team_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get team by ID. User must be a member or admin."""
-    team = TeamService.get_team_by_id(db, team_id)
+    user_id = current_user.user_id
+    user_role = current_user.role
+
+    team, membership, _ = TeamService.get_team_with_membership(db, team_id, user_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found",
         )
 
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
-
     # Check if user is admin or team member
-    if user_role != "admin" and not TeamService.is_team_member(db, team_id, user_id):
+    if user_role != "admin" and membership is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You are not a member of this team",
         )
 
-    # Convert UUIDs to strings for response
-    return {
-        "id": str(team.id),
-        "name": team.name,
-        "description": team.description,
-        "language": team.language,
-        "created_by": str(team.created_by),
-        "created_at": team.created_at,
-        "updated_at": team.updated_at,
-    }
+    return TeamResponse.model_construct(
+        id=team.id,
+        name=team.name,
+        description=team.description,
+        language=team.language,
+        created_by=team.created_by,
+        created_at=team.created_at,
+        updated_at=team.updated_at,
+    )
 
 
 @router.put("/{team_id}", response_model=TeamResponse)
-async def update_team(
+def update_team(
     team_id: UUID,
     request: TeamUpdateRequest,
-    current_user: dict = Depends(get_current_team_leader),
+    current_user: AuthContext = Depends(get_current_team_leader),
     db: Session = Depends(get_db),
 ):
     """Update team. Only team leaders or admins can update."""
-    team = TeamService.get_team_by_id(db, team_id)
+    user_id = current_user.user_id
+    user_role = current_user.role
+
+    team, membership, _ = TeamService.get_team_with_membership(db, team_id, user_id)
     if not team:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found",
         )
 
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
-
     # Check if user is admin or team leader
-    if user_role != "admin" and not TeamService.is_team_leader(db, team_id, user_id):
+    is_leader = membership is not None and membership.role == "team_leader"
+    if user_role != "admin" and not is_leader:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only team leaders or admins can update teams",
@@ -161,16 +181,15 @@ async def update_team(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Team not found",
             )
-        # Convert UUIDs to strings for response
-        return {
-            "id": str(updated_team.id),
-            "name": updated_team.name,
-            "description": updated_team.description,
-            "language": updated_team.language,
-            "created_by": str(updated_team.created_by),
-            "created_at": updated_team.created_at,
-            "updated_at": updated_team.updated_at,
-        }
+        return TeamResponse.model_construct(
+            id=updated_team.id,
+            name=updated_team.name,
+            description=updated_team.description,
+            language=updated_team.language,
+            created_by=updated_team.created_by,
+            created_at=updated_team.created_at,
+            updated_at=updated_team.updated_at,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -178,10 +197,10 @@ async def update_team(
         )
 
 
-@router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_team(
+@router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+def delete_team(
     team_id: UUID,
-    current_user: dict = Depends(get_current_admin_user),
+    current_user: AuthContext = Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Delete team. Only admins can delete teams."""
@@ -191,3 +210,4 @@ async def delete_team(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Team not found",
         )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
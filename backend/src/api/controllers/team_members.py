@@ -1,10 +1,12 @@
 """Team members endpoints."""
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from src.database.base import get_db
 from src.services.team_service import TeamService
-from src.api.middleware.auth import get_current_user, get_current_team_leader
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.api.middleware.auth import AuthContext, get_current_user, get_current_team_leader
 from src.api.schemas.team import (
     TeamMemberResponse,
     TeamMemberListResponse,
@@ -16,16 +18,17 @@ from .team_controller import router  # noqa: E402
 
 
 @router.get("/{team_id}/members", response_model=TeamMemberListResponse)
-async def get_team_members(
+def get_team_members(
     team_id: UUID,
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    page: int = Query(1, ge=1, description="Page number (1-indexed). Deprecated: use cursor", deprecated=True),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page"),
-    current_user: dict = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; takes precedence over page"),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get all members of a team with pagination. User must be a member or admin."""
-    user_id = UUID(current_user["user_id"])
-    user_role = current_user.get("role")
+    user_id = current_user.user_id
+    user_role = current_user.role
 
     # Check if user is admin or team member
     if user_role != "admin" and not TeamService.is_team_member(db, team_id, user_id):
@@ -34,17 +37,33 @@ async def get_team_members(
             detail="You are not a member of this team",
         )
 
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
     skip = (page - 1) * page_size
+    # One extra row tells whether another page exists
     members_with_users, total = TeamService.get_team_members_with_users(
-        db, team_id, skip=skip, limit=page_size
+        db, team_id, skip=skip, limit=page_size + 1, after=after
     )
+
+    next_cursor = None
+    if len(members_with_users) > page_size:
+        members_with_users = members_with_users[:page_size]
+        last_member = members_with_users[-1][0]
+        next_cursor = encode_cursor(last_member.joined_at, last_member.id)
     
-    # Convert UUIDs to strings for response and include user information
+    # Include user information with each member; rows come straight from the
+    # database, so skip per-field validation
     members = [
-        TeamMemberResponse(
-            id=str(member.id),
-            team_id=str(member.team_id),
-            user_id=str(member.user_id),
+        TeamMemberResponse.model_construct(
+            id=member.id,
+            team_id=member.team_id,
+            user_id=member.user_id,
             role=member.role,
             joined_at=member.joined_at,
             user_name=user.name,
@@ -53,25 +72,26 @@ async def get_team_members(
         for member, user in members_with_users
     ]
     
-    return TeamMemberListResponse(
+    return TeamMemberListResponse.model_construct(
         members=members,
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
 @router.post("/{team_id}/members", response_model=TeamMemberResponse, status_code=status.HTTP_201_CREATED)
-async def add_member(
+def add_member(
     team_id: UUID,
     user_id: UUID,
     role: str = "member",
-    current_user: dict = Depends(get_current_team_leader),
+    current_user: AuthContext = Depends(get_current_team_leader),
     db: Session = Depends(get_db),
 ):
     """Add a member to a team. Only team leaders or admins can add members."""
-    user_role = current_user.get("role")
-    current_user_id = UUID(current_user["user_id"])
+    user_role = current_user.role
+    current_user_id = current_user.user_id
 
     # Check if user is admin or team leader
     if user_role != "admin" and not TeamService.is_team_leader(db, team_id, current_user_id):
@@ -82,14 +102,13 @@ async def add_member(
 
     try:
         team_member = TeamService.add_member(db, team_id, user_id, role)
-        # Convert UUIDs to strings for response
-        return {
-            "id": str(team_member.id),
-            "team_id": str(team_member.team_id),
-            "user_id": str(team_member.user_id),
-            "role": team_member.role,
-            "joined_at": team_member.joined_at,
-        }
+        return TeamMemberResponse.model_construct(
+            id=team_member.id,
+            team_id=team_member.team_id,
+            user_id=team_member.user_id,
+            role=team_member.role,
+            joined_at=team_member.joined_at,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -97,16 +116,16 @@ async def add_member(
         )
 
 
-@router.delete("/{team_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def remove_member(
+@router.delete("/{team_id}/members/{user_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+def remove_member(
     team_id: UUID,
     user_id: UUID,
-    current_user: dict = Depends(get_current_team_leader),
+    current_user: AuthContext = Depends(get_current_team_leader),
     db: Session = Depends(get_db),
 ):
     """Remove a member from a team. Only team leaders or admins can remove members."""
-    user_role = current_user.get("role")
-    current_user_id = UUID(current_user["user_id"])
+    user_role = current_user.role
+    current_user_id = current_user.user_id
 
     # Check if user is admin or team leader
     if user_role != "admin" and not TeamService.is_team_leader(db, team_id, current_user_id):
@@ -129,19 +148,20 @@ async def remove_member(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.put("/{team_id}/members/{user_id}/role", response_model=TeamMemberResponse)
-async def update_member_role(
+def update_member_role(
     team_id: UUID,
     user_id: UUID,
     role: str,
-    current_user: dict = Depends(get_current_team_leader),
+    current_user: AuthContext = Depends(get_current_team_leader),
     db: Session = Depends(get_db),
 ):
     """Update a team member's role. Only team leaders or admins can update roles."""
-    user_role = current_user.get("role")
-    current_user_id = UUID(current_user["user_id"])
+    user_role = current_user.role
+    current_user_id = current_user.user_id
 
     # Check if user is admin or team leader
     if user_role != "admin" and not TeamService.is_team_leader(db, team_id, current_user_id):
@@ -157,14 +177,13 @@ async def update_member_role(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Team member not found",
             )
-        # Convert UUIDs to strings for response
-        return {
-            "id": str(team_member.id),
-            "team_id": str(team_member.team_id),
-            "user_id": str(team_member.user_id),
-            "role": team_member.role,
-            "joined_at": team_member.joined_at,
-        }
+        return TeamMemberResponse.model_construct(
+            id=team_member.id,
+            team_id=team_member.team_id,
+            user_id=team_member.user_id,
+            role=team_member.role,
+            joined_at=team_member.joined_at,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,15 +1,17 @@
 """Team settings endpoints (language, invitations)."""
+import logging
+import string
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from src.database.base import get_db
-from src.database.models import User
+from src.database.base import get_db, SessionLocal
+from src.database.models import InvitationCode
 from src.services.team_service import TeamService
 from src.services.invitation_service import InvitationService
 from src.services.email_service import email_service
-from src.api.middleware.auth import get_current_team_leader
+from src.api.middleware.auth import AuthContext, get_current_team_leader
 from src.config import settings
 from src.api.schemas.team import (
     TeamResponse,
@@ -21,17 +23,98 @@ from src.api.schemas.team import (
 # Note: Import at end to avoid circular import
 from .team_controller import router  # noqa: E402
 
+logger = logging.getLogger(__name__)
+
+# "Added to team" notification email. The static head and foot are built once;
+# only the body (team name, inviter, role, link) is substituted per send.
+_ADD_EMAIL_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Team Member Added</title>
+</head>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+"""
+
+_ADD_EMAIL_HTML_BODY = string.Template("""    <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px;">
+        <h1 style="color: #2563eb; margin-top: 0;">You've been added to $team_name!</h1>
+    </div>
+
+    <div style="background-color: #ffffff; padding: 20px; border: 1px solid #e5e7eb; border-radius: 8px;">
+        <p>Hello,</p>
+
+        <p>You've been added$inviter_text to <strong>$team_name</strong> on InTracker as a <strong>$member_role</strong>.</p>
+
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="$team_url" 
+               style="display: inline-block; background-color: #2563eb; color: #ffffff; padding: 12px 24px; text-decoration: none; border-radius: 6px; font-weight: bold;">
+                View Team
+            </a>
+        </div>
+    </div>
+""")
+
+_ADD_EMAIL_HTML_FOOT = """
+    <div style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px; text-align: center;">
+        <p>This is an automated message from InTracker. Please do not reply to this email.</p>
+    </div>
+</body>
+</html>
+"""
+
+_ADD_EMAIL_TEXT = string.Template("""You've been added$inviter_text to $team_name on InTracker as a $member_role.
+
+View your team: $team_url
+
+This is an automated message from InTracker. Please do not reply to this email.""")
+
+
+def _send_invitation_email_and_record(
+    invitation_id: UUID,
+    to_email: str,
+    invitation_code: str,
+    team_name: str,
+    inviter_name: Optional[str],
+    expires_in_days: int,
+) -> None:
+    """Send a team invitation email and record it on the invitation (background task).
+
+    Runs after the response is sent, so it uses its own database session.
+    """
+    email_sent = email_service.send_invitation_email(
+        to_email=to_email,
+        invitation_code=invitation_code,
+        team_name=team_name,
+        inviter_name=inviter_name,
+        expires_in_days=expires_in_days,
+    )
+    if not email_sent:
+        # Log warning but keep the invitation
+        logger.warning(f"Failed to send invitation email to {to_email}, but invitation was created")
+        return
+
+    db = SessionLocal()
+    try:
+        invitation = db.query(InvitationCode).filter(InvitationCode.id == invitation_id).first()
+        if invitation:
+            invitation.email_sent_to = to_email
+            invitation.email_sent_at = datetime.utcnow()
+            db.commit()
+    finally:
+        db.close()
+
 
 @router.post("/{team_id}/language", response_model=TeamResponse, status_code=status.HTTP_200_OK)
-async def set_team_language(
+def set_team_language(
     team_id: UUID,
     request: TeamLanguageRequest,
-    current_user: dict = Depends(get_current_team_leader),
+    current_user: AuthContext = Depends(get_current_team_leader),
     db: Session = Depends(get_db),
 ):
     """Set team language. Only team leaders can set language, and it can only be set once."""
-    user_role = current_user.get("role")
-    current_user_id = UUID(current_user["user_id"])
+    user_role = current_user.role
+    current_user_id = current_user.user_id
 
     # Check if user is admin or team leader
     if user_role != "admin" and not TeamService.is_team_leader(db, team_id, current_user_id):
@@ -46,16 +129,15 @@ async def set_team_language(
             team_id=team_id,
             language=request.language,
         )
-        # Convert UUIDs to strings for response
-        return {
-            "id": str(team.id),
-            "name": team.name,
-            "description": team.description,
-            "language": team.language,
-            "created_by": str(team.created_by),
-            "created_at": team.created_at,
-            "updated_at": team.updated_at,
-        }
+        return TeamResponse.model_construct(
+            id=team.id,
+            name=team.name,
+            description=team.description,
+            language=team.language,
+            created_by=team.created_by,
+            created_at=team.created_at,
+            updated_at=team.updated_at,
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -64,12 +146,13 @@ async def set_team_language(
 
 
 @router.post("/{team_id}/invitations", response_model=TeamInvitationResponse, status_code=status.HTTP_201_CREATED)
-async def create_team_invitation(
+def create_team_invitation(
     team_id: UUID,
+    background_tasks: BackgroundTasks,
     expires_in_days: Optional[int] = Query(7, ge=1, le=365),
     send_email_to: Optional[str] = Query(None, description="Email address to send invitation to"),
     member_role: str = Query("member", description="Role for the invited user (member or team_leader)"),
-    current_user: dict = Depends(get_current_team_leader),
+    current_user: AuthContext = Depends(get_current_team_leader),
     db: Session = Depends(get_db),
 ):
     """Create a team invitation code. Only team leaders or admins can create invitations.
@@ -80,12 +163,24 @@ async def create_team_invitation(
         send_email_to: Optional email address to send invitation to
         member_role: Role for the invited user (member or team_leader). Default: member.
                     Only admins can create team_leader invitations.
+
+    Emails are sent in the background after the response, so email_sent_at is
+    only filled in once the send has succeeded.
     """
-    user_role = current_user.get("role")
-    current_user_id = UUID(current_user["user_id"])
+    user_role = current_user.role
+    current_user_id = current_user.user_id
+
+    # Team, caller's membership and caller's user record in one query
+    team, membership, inviter = TeamService.get_team_with_membership(db, team_id, current_user_id)
+    if not team:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Team not found",
+        )
 
     # Check if user is admin or team leader
-    if user_role != "admin" and not TeamService.is_team_leader(db, team_id, current_user_id):
+    is_leader = membership is not None and membership.role == "team_leader"
+    if user_role != "admin" and not is_leader:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only team leaders or admins can create team invitations",
@@ -106,31 +201,16 @@ async def create_team_invitation(
         )
 
     try:
-        # Get team and inviter info
-        team = TeamService.get_team_by_id(db, team_id)
-        if not team:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Team not found",
-            )
-        
-        inviter = db.query(User).filter(User.id == current_user_id).first()
         inviter_name = inviter.name if inviter else None
 
         # If email is provided, check if user already exists
         existing_user = None
         if send_email_to:
-            existing_user = db.query(User).filter(User.email.ilike(send_email_to)).first()
+            existing_user, is_already_member = InvitationService.lookup_invitee(db, team_id, send_email_to)
             
             # If user exists and is not already a team member, add them directly
             if existing_user:
-                from src.database.models import TeamMember
-                existing_member = db.query(TeamMember).filter(
-                    TeamMember.team_id == team_id,
-                    TeamMember.user_id == existing_user.id
-                ).first()
-                
-                if existing_member:
+                if is_already_member:
                     # User is already a team member
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -152,47 +232,21 @@ async def create_team_invitation(
                     
                     inviter_text = f" from {inviter_name}" if inviter_name else ""
                     subject = f"You've been added to {team.name} on InTracker"
-                    html_content = f"""
-                    <!DOCTYPE html>
-                    <html>
-                    <head>
-                        <meta charset="utf-8">
-                        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                        <title>Team Member Added</title>
-                    </head>
-                    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-                        <div style="background-color: #f8f9fa; padding: 20px; border-radius: 8px; margin-bottom: 20px;">
-                            <h1 style="color: #2563eb; margin-top: 0;">You've been added to {team.name}!</h1>
-                        </div>
-                        
-                        <div style="background-color: #ffffff; padding: 20px; border: 1px solid #e5e7eb; border-radius: 8px;">
-                            <p>Hello,</p>
-                            
-                            <p>You've been added{inviter_text} to <strong>{team.name}</strong> on InTracker as a <strong>{member_role}</strong>.</p>
-                            
-                            <div style="text-align: center; margin: 30px 0;">
-                                <a href="{team_url}" 
-                                   style="display: inline-block; background-color: #2563eb; color: #ffffff; padding: 12px 24px; text-decoration: none; border-radius: 6px; font-weight: bold;">
-                                    View Team
-                                </a>
-                            </div>
-                        </div>
-                        
-                        <div style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px; text-align: center;">
-                            <p>This is an automated message from InTracker. Please do not reply to this email.</p>
-                        </div>
-                    </body>
-                    </html>
-                    """
-                    plain_text_content = f"""
-You've been added{inviter_text} to {team.name} on InTracker as a {member_role}.
-
-View your team: {team_url}
-
-This is an automated message from InTracker. Please do not reply to this email.
-                    """.strip()
+                    template_vars = {
+                        "team_name": team.name,
+                        "inviter_text": inviter_text,
+                        "member_role": member_role,
+                        "team_url": team_url,
+                    }
+                    html_content = "".join((
+                        _ADD_EMAIL_HTML_HEAD,
+                        _ADD_EMAIL_HTML_BODY.substitute(template_vars),
+                        _ADD_EMAIL_HTML_FOOT,
+                    ))
+                    plain_text_content = _ADD_EMAIL_TEXT.substitute(template_vars)
                     
-                    email_sent = email_service.send_email(
+                    background_tasks.add_task(
+                        email_service.send_email,
                         to_email=send_email_to,
                         subject=subject,
                         html_content=html_content,
@@ -204,11 +258,11 @@ This is an automated message from InTracker. Please do not reply to this email.
                     return TeamInvitationResponse(
                         code=f"DIRECT_ADD:{team_member.id}",  # Special code to indicate direct add
                         type="team",
-                        team_id=str(team_id),
+                        team_id=team_id,
                         expires_at=None,
-                        created_at=team_member.joined_at.isoformat() if team_member.joined_at else datetime.utcnow().isoformat(),
+                        created_at=team_member.joined_at or datetime.utcnow(),
                         email_sent_to=send_email_to,
-                        email_sent_at=datetime.utcnow().isoformat() if email_sent else None,
+                        email_sent_at=None,
                     )
 
         # User doesn't exist, create invitation
@@ -225,38 +279,26 @@ This is an automated message from InTracker. Please do not reply to this email.
             # Check if email was already sent to this address for this invitation
             if invitation.email_sent_to and invitation.email_sent_to.lower() == send_email_to.lower():
                 # Email already sent, don't send again
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.info(f"Invitation email already sent to {send_email_to} for invitation {invitation.code}")
             else:
-                from src.services.email_service import email_service
-                from datetime import datetime
-                email_sent = email_service.send_invitation_email(
+                background_tasks.add_task(
+                    _send_invitation_email_and_record,
+                    invitation_id=invitation.id,
                     to_email=send_email_to,
                     invitation_code=invitation.code,
                     team_name=team.name,
                     inviter_name=inviter_name,
                     expires_in_days=expires_in_days,
                 )
-                if email_sent:
-                    # Mark email as sent
-                    invitation.email_sent_to = send_email_to
-                    invitation.email_sent_at = datetime.utcnow()
-                    db.commit()
-                else:
-                    # Log warning but don't fail the request
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Failed to send invitation email to {send_email_to}, but invitation was created")
         
         return TeamInvitationResponse(
             code=invitation.code,
             type=invitation.type,
-            team_id=str(invitation.team_id) if invitation.team_id else None,
-            expires_at=invitation.expires_at.isoformat() if invitation.expires_at else None,
-            created_at=invitation.created_at.isoformat(),
+            team_id=invitation.team_id,
+            expires_at=invitation.expires_at,
+            created_at=invitation.created_at,
             email_sent_to=invitation.email_sent_to,
-            email_sent_at=invitation.email_sent_at.isoformat() if invitation.email_sent_at else None,
+            email_sent_at=invitation.email_sent_at,
         )
     except ValueError as e:
         raise HTTPException(
@@ -1,15 +1,29 @@
 """Todo controller."""
-from typing import Optional
+import hashlib
+import time
+from typing import Any, List, Literal, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query, BackgroundTasks
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 from src.database.base import get_db
-from src.database.models import ProjectElement
-from src.api.middleware.auth import get_current_user
+from src.database.models import ProjectElement, Todo
+from src.api.middleware.auth import AuthContext, get_current_user
+from src.api.middleware.error_handler import raise_http_exception
 from src.services.todo_service import todo_service
+from src.utils.pagination import decode_cursor, encode_cursor
 from src.services.project_service import project_service
 from src.services.feature_service import feature_service
-from src.services.signalr_hub import broadcast_todo_update, broadcast_feature_update
+from src.services.cache_service import CacheService, CacheTTL
+from src.services.signalr_hub import (
+    broadcast_batch,
+    broadcast_todo_update,
+    feature_updated_message,
+    todo_updated_message,
+)
 from src.api.schemas.todo import (
     TodoCreate,
     TodoUpdate,
@@ -17,18 +31,67 @@ from src.api.schemas.todo import (
     TodoListResponse,
 )
 
+# Endpoints are plain def: they use the synchronous SQLAlchemy session, so FastAPI
+# runs them in its threadpool instead of blocking the event loop.
 router = APIRouter(prefix="/todos", tags=["todos"])
 
+# Built once so every call reuses SQLAlchemy's cached compiled statement
+_ELEMENT_BY_ID = select(ProjectElement).where(ProjectElement.id == bindparam("element_id"))
+
+# GET responses are cached for CacheTTL.RESPONSE seconds, then kept up to
+# CacheTTL.LONG as a stale copy served only if the database is unreachable.
+# Keys live under todo:{id} and project:{id}:*, which the TodoService mutators clear.
+
+
+def _get_cached_response(key: str) -> tuple[Optional[Any], bool]:
+    """Return (body, is_fresh) for a cached GET response, or (None, False)."""
+    entry = CacheService.get_cache(key)
+    if not entry:
+        return None, False
+    return entry["body"], time.time() < entry["stale_at"]
+
+
+def _set_cached_response(key: str, body: Any) -> None:
+    CacheService.set_cache(
+        key,
+        {"body": body, "stale_at": time.time() + CacheTTL.RESPONSE},
+        ttl=CacheTTL.LONG,
+    )
+
+
+_TODO_RESPONSE_FIELDS = tuple(TodoResponse.model_fields)
+
+
+def _todo_list_body(
+    todos: List[Todo],
+    total: int,
+    page: int,
+    page_size: int,
+    next_cursor: Optional[str] = None,
+) -> dict:
+    """Build a TodoListResponse-shaped dict straight from the rows.
+
+    Up to 100 rows per page come from the database already typed, so they are read
+    column by column instead of being validated through TodoResponse one by one.
+    """
+    return {
+        "todos": [{field: getattr(todo, field) for field in _TODO_RESPONSE_FIELDS} for todo in todos],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
+
 
 @router.post("", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
-async def create_todo(
+def create_todo(
     todo_data: TodoCreate,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a new todo."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     try:
         # If element_id is not provided, get project_id from feature or use provided project_id
         project_id = todo_data.project_id
@@ -54,31 +117,32 @@ async def create_todo(
         )
         
         # Broadcast todo creation via SignalR
-        element = db.query(ProjectElement).filter(ProjectElement.id == todo.element_id).first()
+        element = db.execute(_ELEMENT_BY_ID, {"element_id": todo.element_id}).scalar_one_or_none()
         if element:
-            background_tasks.add_task(
-                broadcast_todo_update,
-                str(element.project_id),
-                str(todo.id),
-                UUID(current_user["user_id"]),
-                {
-                    "title": todo.title,
-                    "status": todo.status,
-                    "action": "created"
-                }
-            )
+            messages = [
+                todo_updated_message(
+                    str(element.project_id),
+                    str(todo.id),
+                    current_user.user_id,
+                    {
+                        "title": todo.title,
+                        "status": todo.status,
+                        "action": "created"
+                    }
+                )
+            ]
             
             # Update feature progress if todo is linked to a feature
             if todo.feature_id:
-                progress = feature_service.calculate_feature_progress(db=db, feature_id=todo.feature_id)
-                feature = feature_service.get_feature_by_id(db=db, feature_id=todo.feature_id)
-                background_tasks.add_task(
-                    broadcast_feature_update,
+                feature, percentage = feature_service.get_feature_with_progress(db=db, feature_id=todo.feature_id)
+                messages.append(feature_updated_message(
                     str(element.project_id),
                     str(todo.feature_id),
-                    progress["percentage"],
+                    percentage,
                     feature.status if feature else None
-                )
+                ))
+            # One background task and one frame per connection for all events
+            background_tasks.add_task(broadcast_batch, str(element.project_id), messages)
         
         return todo
     except ValueError as e:
@@ -90,7 +154,7 @@ async def create_todo(
 
 
 @router.get("", response_model=TodoListResponse)
-async def list_todos(
+def list_todos(
     project_id: Optional[UUID] = Query(None),
     feature_id: Optional[UUID] = Query(None),
     element_id: Optional[UUID] = Query(None),
@@ -98,18 +162,21 @@ async def list_todos(
     status_filter: Optional[str] = Query(None, alias="status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    current_user: dict = Depends(get_current_user),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page of assigned todos; takes precedence over page",
+    ),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List todos with filtering."""
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     skip = (page - 1) * page_size
 
     # Priority: project_id > feature_id > element_id > assigned_to
     if project_id:
         # Get all todos for the project
         # Check project access
-        from src.services.project_service import project_service
         if not project_service.check_user_access(
             db=db,
             user_id=user_id,
@@ -121,104 +188,152 @@ async def list_todos(
                 error_code="FORBIDDEN",
             )
         
-        todos, total = todo_service.get_todos_by_project(
-            db=db,
-            project_id=project_id,
-            status=status_filter,
-            skip=skip,
-            limit=page_size,
+        # Project listings don't depend on the caller once access is checked
+        cache_key = (
+            f"project:{project_id}:todos:{feature_id}:{element_id}:{assigned_to}"
+            f":{status_filter}:{page}:{page_size}"
         )
-        
-        # Additional filters
-        if feature_id:
-            todos = [t for t in todos if t.feature_id == feature_id]
-        if element_id:
-            todos = [t for t in todos if t.element_id == element_id]
-        if assigned_to:
-            todos = [t for t in todos if t.assigned_to == assigned_to]
+        cached, fresh = _get_cached_response(cache_key)
+        if fresh:
+            return Response(content=cached, media_type="application/json")
+
+        try:
+            todos, total = todo_service.get_todos_by_project(
+                db=db,
+                project_id=project_id,
+                status=status_filter,
+                skip=skip,
+                limit=page_size,
+                feature_id=feature_id,
+                element_id=element_id,
+                assigned_to=assigned_to,
+            )
+        except OperationalError:
+            if cached is None:
+                raise
+            return Response(content=cached, media_type="application/json")
+
+        # Cache the encoded JSON so hits skip serialization entirely
+        content = orjson.dumps(_todo_list_body(todos, total, page, page_size))
+        _set_cached_response(cache_key, content.decode())
+        return Response(content=content, media_type="application/json")
     elif feature_id:
         # Get todos for a specific feature
-        todos = todo_service.get_todos_by_feature(
+        todos, total = todo_service.get_todos_by_feature(
             db=db,
             feature_id=feature_id,
             status=status_filter,
+            skip=skip,
+            limit=page_size,
         )
-        total = len(todos)
-        # Apply pagination
-        todos = todos[skip:skip + page_size]
     elif element_id:
         # Get todos for a specific element
-        todos = todo_service.get_todos_by_element(
+        todos, total = todo_service.get_todos_by_element(
             db=db,
             element_id=element_id,
             status=status_filter,
+            skip=skip,
+            limit=page_size,
         )
-        total = len(todos)
-        # Apply pagination
-        todos = todos[skip:skip + page_size]
     else:
         # Default: get todos assigned to current user
         if assigned_to is None:
             assigned_to = user_id
+
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
         
+        # One extra row tells whether another page exists
         todos, total = todo_service.get_todos_by_user(
             db=db,
             user_id=assigned_to,
             status=status_filter,
             skip=skip,
-            limit=page_size,
+            limit=page_size + 1,
+            after=after,
         )
 
-    return TodoListResponse(
-        todos=todos,
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+        next_cursor = None
+        if len(todos) > page_size:
+            todos = todos[:page_size]
+            next_cursor = encode_cursor(todos[-1].created_at, todos[-1].id)
+        return ORJSONResponse(_todo_list_body(todos, total, page, page_size, next_cursor))
+
+    return ORJSONResponse(_todo_list_body(todos, total, page, page_size))
 
 
 @router.get("/{todo_id}", response_model=TodoResponse)
-async def get_todo(
+def get_todo(
     todo_id: UUID,
-    current_user: dict = Depends(get_current_user),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get todo by ID."""
-    todo = todo_service.get_todo_by_id(db=db, todo_id=todo_id)
-    if not todo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo not found",
-        )
+    """Get todo by ID.
+
+    The response carries a weak ETag derived from the serialized todo; a
+    matching If-None-Match gets 304 Not Modified with no body.
+    """
+    cache_key = f"todo:{todo_id}"
+    cached, fresh = _get_cached_response(cache_key)
+    if fresh:
+        project_id, body = cached["project_id"], cached["todo"]
+    else:
+        try:
+            todo = todo_service.get_todo_with_element(db=db, todo_id=todo_id)
+        except OperationalError:
+            if cached is None:
+                raise
+            project_id, body = cached["project_id"], cached["todo"]
+        else:
+            if not todo:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Todo not found",
+                )
+            project_id = str(todo.element.project_id) if todo.element else None
+            body = TodoResponse.model_validate(todo).model_dump(mode="json")
+            _set_cached_response(cache_key, {"project_id": project_id, "todo": body})
 
-    # Check project access through element
-    from src.database.models import ProjectElement
-    element = db.query(ProjectElement).filter(ProjectElement.id == todo.element_id).first()
-    if element:
+    # Check project access through element; the cached body is shared across users
+    if project_id:
         if not project_service.check_user_access(
             db=db,
-            user_id=UUID(current_user["user_id"]),
-            project_id=element.project_id,
+            user_id=current_user.user_id,
+            project_id=UUID(project_id),
         ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have access to this todo's project",
             )
 
-    return todo
+    # Hash the body rather than use version: some writes (GitHub links, FK
+    # ON DELETE SET NULL) change the todo without bumping it
+    digest = hashlib.blake2b(orjson.dumps(body, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+    etag = f'W/"{digest}"'
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return body
 
 
 @router.put("/{todo_id}", response_model=TodoResponse)
-async def update_todo(
+def update_todo(
     todo_id: UUID,
     todo_data: TodoUpdate,
-    expected_version: Optional[int] = Query(None),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    expected_version: Optional[int] = Query(None, ge=1),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update todo with optimistic locking."""
-    todo = todo_service.get_todo_by_id(db=db, todo_id=todo_id)
+    todo = todo_service.get_todo_with_element(db=db, todo_id=todo_id)
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -226,13 +341,14 @@ async def update_todo(
         )
 
     # Check project access through element
-    from src.database.models import ProjectElement
-    element = db.query(ProjectElement).filter(ProjectElement.id == todo.element_id).first()
+    element = todo.element
+    # Read before any commit below expires the element
+    project_id = element.project_id if element else None
     if element:
         if not project_service.check_user_access(
             db=db,
-            user_id=UUID(current_user["user_id"]),
-            project_id=element.project_id,
+            user_id=current_user.user_id,
+            project_id=project_id,
             required_role="editor",
         ):
             raise HTTPException(
@@ -253,6 +369,7 @@ async def update_todo(
             assigned_to=todo_data.assigned_to,
             feature_id=todo_data.feature_id,
             expected_version=expected_version or todo.version,
+            todo=todo,
         )
 
         if not updated_todo:
@@ -261,9 +378,8 @@ async def update_todo(
                 detail="Todo not found",
             )
 
-        # Broadcast todo update via SignalR
-        element = db.query(ProjectElement).filter(ProjectElement.id == updated_todo.element_id).first()
-        if element:
+        # Broadcast todo update via SignalR (element_id never changes on update)
+        if project_id:
             changes = {
                 "title": todo_data.title if todo_data.title is not None else None,
                 "description": todo_data.description if todo_data.description is not None else None,
@@ -273,25 +389,20 @@ async def update_todo(
             }
             # Remove None values
             changes = {k: v for k, v in changes.items() if v is not None}
-            background_tasks.add_task(
-                broadcast_todo_update,
-                str(element.project_id),
-                str(updated_todo.id),
-                UUID(current_user["user_id"]),
-                changes
-            )
+            messages = [
+                todo_updated_message(str(project_id), str(updated_todo.id), current_user.user_id, changes)
+            ]
             
             # Update feature progress if todo is linked to a feature and status changed
             if updated_todo.feature_id and todo_data.status is not None:
-                progress = feature_service.calculate_feature_progress(db=db, feature_id=updated_todo.feature_id)
-                feature = feature_service.get_feature_by_id(db=db, feature_id=updated_todo.feature_id)
-                background_tasks.add_task(
-                    broadcast_feature_update,
-                    str(element.project_id),
+                feature, percentage = feature_service.get_feature_with_progress(db=db, feature_id=updated_todo.feature_id)
+                messages.append(feature_updated_message(
+                    str(project_id),
                     str(updated_todo.feature_id),
-                    progress["percentage"],
+                    percentage,
                     feature.status if feature else None
-                )
+                ))
+            background_tasks.add_task(broadcast_batch, str(project_id), messages)
 
         return updated_todo
     except ValueError as e:
@@ -307,14 +418,14 @@ async def update_todo(
 
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_todo(
+def delete_todo(
     todo_id: UUID,
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Delete todo."""
-    todo = todo_service.get_todo_by_id(db=db, todo_id=todo_id)
+    todo = todo_service.get_todo_with_element(db=db, todo_id=todo_id)
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -322,13 +433,13 @@ async def delete_todo(
         )
 
     # Check project access through element
-    from src.database.models import ProjectElement
-    element = db.query(ProjectElement).filter(ProjectElement.id == todo.element_id).first()
+    element = todo.element
+    project_id = element.project_id if element else None
     if element:
         if not project_service.check_user_access(
             db=db,
-            user_id=UUID(current_user["user_id"]),
-            project_id=element.project_id,
+            user_id=current_user.user_id,
+            project_id=project_id,
             required_role="editor",
         ):
             raise HTTPException(
@@ -347,42 +458,42 @@ async def delete_todo(
         )
 
     # Broadcast todo deletion via SignalR
-    if element:
-        background_tasks.add_task(
-            broadcast_todo_update,
-            str(element.project_id),
-            str(todo_id),
-            UUID(current_user["user_id"]),
-            {
-                "action": "deleted",
-                "todoId": str(todo_id)
-            }
-        )
+    if project_id:
+        messages = [
+            todo_updated_message(
+                str(project_id),
+                str(todo_id),
+                current_user.user_id,
+                {
+                    "action": "deleted",
+                    "todoId": str(todo_id)
+                }
+            )
+        ]
         
         # Update feature progress if todo was linked to a feature
         if feature_id:
-            progress = feature_service.calculate_feature_progress(db=db, feature_id=feature_id)
-            feature = feature_service.get_feature_by_id(db=db, feature_id=feature_id)
-            background_tasks.add_task(
-                broadcast_feature_update,
-                str(element.project_id),
+            feature, percentage = feature_service.get_feature_with_progress(db=db, feature_id=feature_id)
+            messages.append(feature_updated_message(
+                str(project_id),
                 str(feature_id),
-                progress["percentage"],
+                percentage,
                 feature.status if feature else None
-            )
+            ))
+        background_tasks.add_task(broadcast_batch, str(project_id), messages)
 
 
 @router.put("/{todo_id}/status", response_model=TodoResponse)
-async def update_todo_status(
+def update_todo_status(
     todo_id: UUID,
-    status: str = Query(..., pattern="^(new|in_progress|tested|done)$"),
-    expected_version: Optional[int] = Query(None),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    status: Literal["new", "in_progress", "tested", "done"] = Query(...),
+    expected_version: Optional[int] = Query(None, ge=1),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update todo status with optimistic locking."""
-    todo = todo_service.get_todo_by_id(db=db, todo_id=todo_id)
+    todo = todo_service.get_todo_with_element(db=db, todo_id=todo_id)
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -390,13 +501,13 @@ async def update_todo_status(
         )
 
     # Check project access
-    from src.database.models import ProjectElement
-    element = db.query(ProjectElement).filter(ProjectElement.id == todo.element_id).first()
+    element = todo.element
+    project_id = element.project_id if element else None
     if element:
         if not project_service.check_user_access(
             db=db,
-            user_id=UUID(current_user["user_id"]),
-            project_id=element.project_id,
+            user_id=current_user.user_id,
+            project_id=project_id,
             required_role="editor",
         ):
             raise HTTPException(
@@ -404,9 +515,9 @@ async def update_todo_status(
                 detail="You don't have permission to update this todo",
             )
 
-    user_id = UUID(current_user["user_id"])
+    user_id = current_user.user_id
     try:
-        updated_todo = todo_service.update_todo(
+        updated_todo = todo_service.update_todo_status(
             db=db,
             todo_id=todo_id,
             status=status,
@@ -420,28 +531,22 @@ async def update_todo_status(
                 detail="Todo not found",
             )
 
-        # Broadcast todo status update via SignalR
-        element = db.query(ProjectElement).filter(ProjectElement.id == updated_todo.element_id).first()
-        if element:
-            background_tasks.add_task(
-                broadcast_todo_update,
-                str(element.project_id),
-                str(updated_todo.id),
-                UUID(current_user["user_id"]),
-                {"status": status}
-            )
+        # Broadcast todo status update via SignalR (element_id never changes on update)
+        if project_id:
+            messages = [
+                todo_updated_message(str(project_id), str(updated_todo.id), current_user.user_id, {"status": status})
+            ]
             
             # Update feature progress if todo is linked to a feature
             if updated_todo.feature_id:
-                progress = feature_service.calculate_feature_progress(db=db, feature_id=updated_todo.feature_id)
-                feature = feature_service.get_feature_by_id(db=db, feature_id=updated_todo.feature_id)
-                background_tasks.add_task(
-                    broadcast_feature_update,
-                    str(element.project_id),
+                feature, percentage = feature_service.get_feature_with_progress(db=db, feature_id=updated_todo.feature_id)
+                messages.append(feature_updated_message(
+                    str(project_id),
                     str(updated_todo.feature_id),
-                    progress["percentage"],
+                    percentage,
                     feature.status if feature else None
-                )
+                ))
+            background_tasks.add_task(broadcast_batch, str(project_id), messages)
 
         return updated_todo
     except ValueError as e:
@@ -457,15 +562,15 @@ async def update_todo_status(
 
 
 @router.post("/{todo_id}/assign", response_model=TodoResponse)
-async def assign_todo(
+def assign_todo(
     todo_id: UUID,
+    background_tasks: BackgroundTasks,
     user_id: UUID = Query(..., alias="user_id"),
-    background_tasks: BackgroundTasks = BackgroundTasks(),
-    current_user: dict = Depends(get_current_user),
+    current_user: AuthContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Assign todo to a user."""
-    todo = todo_service.get_todo_by_id(db=db, todo_id=todo_id)
+    todo = todo_service.get_todo_with_element(db=db, todo_id=todo_id)
     if not todo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -473,13 +578,13 @@ async def assign_todo(
         )
 
     # Check project access
-    from src.database.models import ProjectElement
-    element = db.query(ProjectElement).filter(ProjectElement.id == todo.element_id).first()
+    element = todo.element
+    project_id = element.project_id if element else None
     if element:
         if not project_service.check_user_access(
             db=db,
-            user_id=UUID(current_user["user_id"]),
-            project_id=element.project_id,
+            user_id=current_user.user_id,
+            project_id=project_id,
             required_role="editor",
         ):
             raise HTTPException(
@@ -487,13 +592,19 @@ async def assign_todo(
                 detail="You don't have permission to assign todos in this project",
             )
 
-    updated_todo = todo_service.update_todo(
-        db=db,
-        todo_id=todo_id,
-        assigned_to=user_id,
-        expected_version=todo.version,
-        current_user_id=user_id,
-    )
+    try:
+        updated_todo = todo_service.assign_todo(
+            db=db,
+            todo_id=todo_id,
+            assigned_to=user_id,
+            expected_version=todo.version,
+            current_user_id=current_user.user_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
 
     if not updated_todo:
         raise HTTPException(
@@ -502,12 +613,12 @@ async def assign_todo(
         )
 
     # Broadcast todo assignment via SignalR
-    if element:
+    if project_id:
         background_tasks.add_task(
             broadcast_todo_update,
-            str(element.project_id),
+            str(project_id),
             str(updated_todo.id),
-            UUID(current_user["user_id"]),
+            current_user.user_id,
             {
                 "assigned_to": str(user_id)
             }
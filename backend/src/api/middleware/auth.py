@@ -1,25 +1,34 @@
 """Authentication middleware."""
+from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from src.database.base import get_db
-from src.database.models import User
-from src.services.auth_service import auth_service
+from src.services.auth_cache import get_user_auth, verify_access_token
 
 security = HTTPBearer()
 
 
+@dataclass(frozen=True, slots=True)
+class AuthContext:
+    """Authenticated user resolved from the access token."""
+    user_id: UUID
+    role: str
+    email: Optional[str] = None
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> dict:
-    """Get current authenticated user from JWT token with role."""
+) -> AuthContext:
+    """Get current authenticated user from JWT token with role.
+
+    No session dependency: the role lookup is cached, and a session is only
+    opened on a cache miss after the token has been verified.
+    """
     token = credentials.credentials
 
     try:
-        payload = auth_service.verify_token(token, is_refresh=False)
+        payload = verify_access_token(token)
         if payload.get("type") != "access":
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -32,20 +41,22 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token payload",
             )
+        # Parse once here so handlers can use current_user.user_id as a UUID directly
+        user_id = UUID(user_id)
 
-        # Get user from database to get role
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_active:
+        # Get role from the (briefly cached) users row
+        user_auth = get_user_auth(user_id)
+        if not user_auth or not user_auth[1]:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found or inactive",
             )
 
-        return {
-            "user_id": user_id,
-            "email": payload.get("email"),
-            "role": user.role,
-        }
+        return AuthContext(
+            user_id=user_id,
+            role=user_auth[0],
+            email=payload.get("email"),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -55,41 +66,42 @@ async def get_current_user(
 
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
-    db: Session = Depends(get_db),
-) -> Optional[dict]:
+) -> Optional[AuthContext]:
     """Get optional authenticated user (doesn't fail if no token)."""
     if not credentials:
         return None
 
     try:
         token = credentials.credentials
-        payload = auth_service.verify_token(token, is_refresh=False)
+        payload = verify_access_token(token)
         if payload.get("type") != "access":
             return None
 
         user_id = payload.get("sub")
         if not user_id:
             return None
+        user_id = UUID(user_id)
 
-        # Get user from database to get role
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user or not user.is_active:
+        # Get role from the (briefly cached) users row
+        user_auth = get_user_auth(user_id)
+        if not user_auth or not user_auth[1]:
             return None
 
-        return {
-            "user_id": user_id,
-            "email": payload.get("email"),
-            "role": user.role,
-        }
-    except (ValueError, Exception):
+        return AuthContext(
+            user_id=user_id,
+            role=user_auth[0],
+            email=payload.get("email"),
+        )
+    except ValueError:
+        # Invalid/expired token or malformed subject
         return None
 
 
 async def get_current_admin_user(
-    current_user: dict = Depends(get_current_user),
-) -> dict:
+    current_user: AuthContext = Depends(get_current_user),
+) -> AuthContext:
     """Get current user and verify admin role."""
-    if current_user.get("role") != "admin":
+    if current_user.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
@@ -98,10 +110,10 @@ async def get_current_admin_user(
 
 
 async def get_current_team_leader(
-    current_user: dict = Depends(get_current_user),
-) -> dict:
+    current_user: AuthContext = Depends(get_current_user),
+) -> AuthContext:
     """Get current user and verify team leader or admin role."""
-    role = current_user.get("role")
+    role = current_user.role
     if role not in ["admin", "team_leader"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,69 +1,74 @@
 """Error handling middleware and utilities for standardized error responses."""
+from types import MappingProxyType
 from typing import Optional
-from datetime import datetime
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError
 import logging
 
-from src.api.schemas.error import ErrorResponse, ErrorDetail
+from src.api.schemas.error import ErrorDetail
 from src.api.utils.json_response import OptimizedJSONResponse
 from src.config import settings
-from src.utils.error_logger import log_error, log_http_error
+from src.utils.error_logger import log_error, log_http_error, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
+# HTTP status code -> error type, shared by every HTTPException response
+_ERROR_TYPE_MAP = MappingProxyType({
+    400: "bad_request",
+    401: "unauthorized",
+    403: "forbidden",
+    404: "not_found",
+    409: "conflict",
+    413: "request_entity_too_large",
+    415: "unsupported_media_type",
+    422: "validation_error",
+    429: "rate_limit_exceeded",
+    500: "internal_server_error",
+    503: "service_unavailable",
+})
+
+# NODE_ENV is fixed for the lifetime of the process
+_IS_DEV = settings.is_development()
+_IS_PROD = settings.is_production()
+
 
 def create_error_response(
     error_type: str,
     message: str,
     status_code: int = status.HTTP_400_BAD_REQUEST,
-    details: Optional[list[ErrorDetail]] = None,
+    details: Optional[list[dict]] = None,
     error_code: Optional[str] = None,
 ) -> OptimizedJSONResponse:
     """Create a standardized error response.
     
+    The body follows the ErrorResponse schema but is assembled as a plain
+    dict, so error paths skip the Pydantic model round trip.
+    
     Args:
         error_type: Error category (e.g., "validation_error", "not_found", "unauthorized")
         message: Human-readable error message
         status_code: HTTP status code
-        details: Optional list of detailed error information
+        details: Optional list of detailed error information (ErrorDetail-shaped dicts)
         error_code: Optional error code for programmatic handling
     
     Returns:
         JSONResponse with standardized error format
     """
-    error_response = ErrorResponse(
-        error=error_type,
-        message=message,
-        details=details,
-        code=error_code,
-        timestamp=datetime.utcnow().isoformat() + "Z",
-    )
+    content = {"error": error_type, "message": message}
+    if details:
+        content["details"] = details
+    if error_code is not None:
+        content["code"] = error_code
+    content["timestamp"] = utc_timestamp()
     
-    return OptimizedJSONResponse(
-        status_code=status_code,
-        content=error_response.model_dump(exclude_none=True),
-    )
+    return OptimizedJSONResponse(status_code=status_code, content=content)
 
 
 def handle_http_exception(request: Request, exc: HTTPException) -> OptimizedJSONResponse:
     """Handle HTTPException with standardized error format."""
-    # Map HTTP status codes to error types
-    error_type_map = {
-        400: "bad_request",
-        401: "unauthorized",
-        403: "forbidden",
-        404: "not_found",
-        409: "conflict",
-        422: "validation_error",
-        429: "rate_limit_exceeded",
-        500: "internal_server_error",
-        503: "service_unavailable",
-    }
-    
-    error_type = error_type_map.get(exc.status_code, "error")
+    error_type = _ERROR_TYPE_MAP.get(exc.status_code, "error")
     
     # Extract error code from detail if it's a dict
     error_code = None
@@ -94,17 +99,14 @@ def handle_http_exception(request: Request, exc: HTTPException) -> OptimizedJSON
 
 def handle_validation_error(request: Request, exc: RequestValidationError) -> OptimizedJSONResponse:
     """Handle Pydantic validation errors with standardized format."""
-    details = []
-    
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        details.append(
-            ErrorDetail(
-                field=field_path,
-                message=error["msg"],
-                code=error.get("type", "VALIDATION_ERROR").upper(),
-            )
-        )
+    details = [
+        {
+            "field": " -> ".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "code": error.get("type", "VALIDATION_ERROR").upper(),
+        }
+        for error in exc.errors()
+    ]
     
     # Log validation errors (usually not critical, but useful for debugging)
     log_http_error(
@@ -112,7 +114,7 @@ def handle_validation_error(request: Request, exc: RequestValidationError) -> Op
         message="Invalid input data",
         request=request,
         error_code="VALIDATION_ERROR",
-        details={"validation_errors": [d.model_dump() for d in details]},
+        details={"validation_errors": details},
     )
     
     return create_error_response(
@@ -133,12 +135,12 @@ def handle_generic_exception(request: Request, exc: Exception) -> OptimizedJSONR
         context={
             "handler": "generic_exception_handler",
         },
-        level=logging.CRITICAL if settings.is_production() else logging.ERROR,
+        level=logging.CRITICAL if _IS_PROD else logging.ERROR,
     )
     
     # Don't expose internal error details in production
     message = (
-        str(exc) if settings.is_development() 
+        str(exc) if _IS_DEV
         else "An internal server error occurred"
     )
     
@@ -155,17 +157,21 @@ def raise_http_exception(
     status_code: int,
     message: str,
     error_code: Optional[str] = None,
-    details: Optional[list[ErrorDetail]] = None,
+    details: Optional[list[ErrorDetail | dict]] = None,
 ) -> None:
     """Raise an HTTPException with standardized format.
     
     This is a convenience function for controllers to raise errors
-    that will be automatically formatted by the error handler.
+    that will be automatically formatted by the error handler. Details
+    may be ErrorDetail models or already-built dicts of the same shape.
     """
     detail = {"message": message}
     if error_code:
         detail["code"] = error_code
     if details:
-        detail["details"] = [d.model_dump() for d in details]
+        detail["details"] = [
+            d if isinstance(d, dict) else d.model_dump(exclude_none=True)
+            for d in details
+        ]
     
     raise HTTPException(status_code=status_code, detail=detail)
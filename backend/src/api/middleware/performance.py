@@ -1,10 +1,9 @@
 """Performance monitoring middleware for FastAPI."""
 import time
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from src.utils.error_logger import log_performance_issue
 from src.config import settings
 
@@ -14,8 +13,26 @@ logger = logging.getLogger(__name__)
 SLOW_REQUEST_THRESHOLD = 1.0  # Log requests taking longer than 1 second
 VERY_SLOW_REQUEST_THRESHOLD = 3.0  # Log as error requests taking longer than 3 seconds
 
+# Same thresholds in nanoseconds, compared against perf_counter_ns() deltas
+_SLOW_REQUEST_NS = int(SLOW_REQUEST_THRESHOLD * 1_000_000_000)
+_VERY_SLOW_REQUEST_NS = int(VERY_SLOW_REQUEST_THRESHOLD * 1_000_000_000)
 
-class PerformanceMiddleware(BaseHTTPMiddleware):
+# Paths excluded from performance monitoring
+_SKIP_PATHS = frozenset({
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/health",
+    "/health/ready",
+    "/health/live",
+    "/health/metrics",
+})
+_SKIP_PREFIXES = ("/static",)
+
+_IS_DEV = settings.NODE_ENV == "development"
+
+
+class PerformanceMiddleware:
     """Middleware to monitor and log request performance.
     
     Tracks:
@@ -24,93 +41,106 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
     - Very slow requests (>3s)
     - Request path and method
     
-    Logs performance issues using the centralized error logger.
+    Logs performance issues using the centralized error logger. Implemented as
+    plain ASGI middleware; the duration is taken when the response starts,
+    which is the point BaseHTTPMiddleware's call_next used to return.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Measure request duration and log slow requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Skip performance monitoring for certain paths
-        skip_paths = {
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/health",
-            "/health/ready",
-            "/health/live",
-            "/health/metrics",
-        }
+        path = scope["path"]
+        if path in _SKIP_PATHS or path.startswith(_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
         
-        if request.url.path in skip_paths or request.url.path.startswith("/static"):
-            return await call_next(request)
+        method = scope["method"]
         
         # Start timing
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Calculate duration
+                duration_ns = time.perf_counter_ns() - start_ns
+                status_code = message["status"]
+                
+                # Log slow requests
+                if duration_ns >= _SLOW_REQUEST_NS:
+                    _log_slow_request(method, path, scope.get("query_string"), status_code, duration_ns)
+                
+                # Add performance header (optional, for debugging)
+                if _IS_DEV:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-Response-Time"] = f"{duration_ns / 1_000_000_000:.3f}s"
+            await send(message)
         
         try:
-            # Process request
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Log slow requests
-            if duration >= VERY_SLOW_REQUEST_THRESHOLD:
-                # Very slow - log as error
-                log_performance_issue(
-                    operation=f"{request.method} {request.url.path}",
-                    duration_seconds=duration,
-                    threshold_seconds=VERY_SLOW_REQUEST_THRESHOLD,
-                    context={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": response.status_code,
-                        "query_params": str(request.query_params) if request.query_params else None,
-                    },
-                )
-                logger.error(
-                    f"Very slow request: {request.method} {request.url.path} took {duration:.3f}s "
-                    f"(status: {response.status_code})"
-                )
-            elif duration >= SLOW_REQUEST_THRESHOLD:
-                # Slow - log as warning
-                log_performance_issue(
-                    operation=f"{request.method} {request.url.path}",
-                    duration_seconds=duration,
-                    threshold_seconds=SLOW_REQUEST_THRESHOLD,
-                    context={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": response.status_code,
-                        "query_params": str(request.query_params) if request.query_params else None,
-                    },
-                )
-                logger.warning(
-                    f"Slow request: {request.method} {request.url.path} took {duration:.3f}s "
-                    f"(status: {response.status_code})"
-                )
-            
-            # Add performance header (optional, for debugging)
-            if settings.NODE_ENV == "development":
-                response.headers["X-Response-Time"] = f"{duration:.3f}s"
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            if response_started:
+                raise
+            
             # If an exception occurs, still measure duration
-            duration = time.time() - start_time
+            duration_ns = time.perf_counter_ns() - start_ns
             
             # Log performance even for failed requests
-            if duration >= SLOW_REQUEST_THRESHOLD:
+            if duration_ns >= _SLOW_REQUEST_NS:
                 log_performance_issue(
-                    operation=f"{request.method} {request.url.path} (failed)",
-                    duration_seconds=duration,
+                    operation=f"{method} {path} (failed)",
+                    duration_seconds=duration_ns / 1_000_000_000,
                     threshold_seconds=SLOW_REQUEST_THRESHOLD,
                     context={
-                        "method": request.method,
-                        "path": request.url.path,
+                        "method": method,
+                        "path": path,
                         "error": str(e),
                     },
                 )
             
             # Re-raise the exception
             raise
+
+
+def _log_slow_request(
+    method: str,
+    path: str,
+    query_string: Optional[bytes],
+    status_code: int,
+    duration_ns: int,
+) -> None:
+    """Log a request that crossed the slow or very slow threshold."""
+    duration = duration_ns / 1_000_000_000
+    very_slow = duration_ns >= _VERY_SLOW_REQUEST_NS
+    log_performance_issue(
+        operation=f"{method} {path}",
+        duration_seconds=duration,
+        threshold_seconds=VERY_SLOW_REQUEST_THRESHOLD if very_slow else SLOW_REQUEST_THRESHOLD,
+        context={
+            "method": method,
+            "path": path,
+            "status_code": status_code,
+            "query_params": query_string.decode("ascii", "replace") if query_string else None,
+        },
+    )
+    if very_slow:
+        # Very slow - log as error
+        logger.error(
+            "Very slow request: %s %s took %.3fs (status: %s)",
+            method, path, duration, status_code,
+        )
+    else:
+        # Slow - log as warning
+        logger.warning(
+            "Slow request: %s %s took %.3fs (status: %s)",
+            method, path, duration, status_code,
+        )
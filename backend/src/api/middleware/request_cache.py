@@ -0,0 +1,26 @@
+"""Request cache middleware for FastAPI."""
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.utils.request_cache import request_cache
+
+
+class RequestCacheMiddleware:
+    """Middleware that gives every HTTP request its own memoization dict.
+
+    Implemented as plain ASGI middleware: it only sets a context variable, so it
+    does not need BaseHTTPMiddleware's request/response wrapping.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request with a fresh request cache."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_cache.reset(token)
@@ -1,12 +1,42 @@
 """Security headers middleware for FastAPI."""
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from src.config import settings
 
+# Permissions Policy - restrict browser features
+_PERMISSIONS_POLICY = (
+    "geolocation=(), microphone=(), camera=(), payment=(), "
+    "usb=(), magnetometer=(), gyroscope=(), speaker=()"
+)
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+_HEADERS_NONPROD = {
+    # Prevent MIME type sniffing
+    "X-Content-Type-Options": "nosniff",
+    # Prevent clickjacking
+    "X-Frame-Options": "DENY",
+    # XSS protection (legacy, but still useful)
+    "X-XSS-Protection": "1; mode=block",
+    # Control referrer information
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": _PERMISSIONS_POLICY,
+}
+
+# HSTS - Force HTTPS in production
+_HEADERS_PROD = {
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    **_HEADERS_NONPROD,
+}
+
+# Header set for this environment
+_SECURITY_HEADERS = _HEADERS_PROD if settings.is_production() else _HEADERS_NONPROD
+
+# Raw ASGI form of the headers, appended to http.response.start as-is
+_RAW_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in _SECURITY_HEADERS.items()
+]
+
+
+class SecurityHeadersMiddleware:
     """Middleware to add security headers to all responses.
     
     Adds the following security headers:
@@ -16,42 +46,26 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - X-XSS-Protection
     - Referrer-Policy
     - Permissions-Policy
+    
+    Implemented as plain ASGI middleware that rewrites the header list of
+    the http.response.start message, so responses are not buffered through
+    BaseHTTPMiddleware.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to response."""
-        response = await call_next(request)
-        
-        # HSTS - Force HTTPS in production
-        if settings.is_production():
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-        
-        # XSS protection (legacy, but still useful)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        
-        # Control referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        # Permissions Policy - restrict browser features
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), "
-            "microphone=(), "
-            "camera=(), "
-            "payment=(), "
-            "usb=(), "
-            "magnetometer=(), "
-            "gyroscope=(), "
-            "speaker=()"
-        )
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Remove server header (if present)
-        if "Server" in response.headers:
-            del response.headers["Server"]
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # No route sets these headers itself, so a plain append is enough. Build
+                # a new list: the existing one may be a Response's own raw_headers, or a tuple
+                message["headers"] = [*message.get("headers", ()), *_RAW_SECURITY_HEADERS]
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -1,112 +1,203 @@
 """Request and response validation middleware."""
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
-from fastapi import status
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from fastapi import HTTPException, status
+from functools import lru_cache
+from typing import Optional
 import logging
-from src.api.schemas.error import ErrorResponse, ErrorDetail
-from datetime import datetime
+from src.api.middleware.error_handler import create_error_response
+from src.api.utils.json_response import OptimizedJSONResponse
 
 logger = logging.getLogger(__name__)
 
 # Request size limits (in bytes)
 MAX_REQUEST_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_JSON_BODY_SIZE = 5 * 1024 * 1024  # 5MB for JSON bodies
+_REQUEST_TOO_LARGE_MESSAGE = f"Request body too large. Maximum size is {MAX_REQUEST_SIZE / (1024 * 1024):.1f}MB"
 
-# Allowed content types for JSON endpoints
-ALLOWED_CONTENT_TYPES = {
-    "application/json",
-    "application/json; charset=utf-8",
-    "application/json;charset=utf-8",
+# Paths excluded from request validation
+_SKIP_PATHS = frozenset({
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/health",
+    "/health/ready",
+    "/health/live",
+    "/health/metrics",
+})
+_STATIC_PREFIX = "/static"
+
+# Error types for the responses this middleware produces
+_ERROR_TYPES = {
+    status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: "request_entity_too_large",
+    status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: "unsupported_media_type",
 }
 
+# Allowed media types for JSON endpoints (Content-Type without parameters)
+_JSON_MEDIA_TYPES = frozenset((b"application/json",))
+
+# Content-Type values accepted without parsing: exact match or a parameter follows
+_JSON_CONTENT_TYPE = b"application/json"
+_JSON_CONTENT_TYPE_PREFIXES = (b"application/json;", b"application/json ")
+
+# Long values, and multipart values (whose boundary is unique per request), are
+# parsed without caching so they can't churn the cache
+_MAX_CACHED_CONTENT_TYPE = 256
+
+
+def _parse_content_type_uncached(content_type: bytes) -> tuple[bytes, bool]:
+    """Return (media_type, is_multipart) for a raw Content-Type header value."""
+    media_type = content_type.split(b";", 1)[0].strip()
+    # Clients almost always send lowercase; only copy when there is uppercase
+    if not media_type.islower():
+        media_type = media_type.lower()
+    return media_type, media_type == b"multipart/form-data"
+
+
+_parse_content_type_cached = lru_cache(maxsize=64)(_parse_content_type_uncached)
+
+
+def _parse_content_type(content_type: bytes) -> tuple[bytes, bool]:
+    """Parse a Content-Type header, caching the handful of values real clients send."""
+    if len(content_type) > _MAX_CACHED_CONTENT_TYPE or b"boundary=" in content_type:
+        return _parse_content_type_uncached(content_type)
+    return _parse_content_type_cached(content_type)
 
-class ValidationMiddleware(BaseHTTPMiddleware):
+
+def _limit_body_size(receive: Receive) -> Receive:
+    """Wrap receive so a body larger than MAX_REQUEST_SIZE fails with 413 mid-stream."""
+    received = 0
+    
+    async def bounded_receive() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > MAX_REQUEST_SIZE:
+                # Raised while the route reads its body, so the HTTPException
+                # handler turns it into the standard error response
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail={"message": _REQUEST_TOO_LARGE_MESSAGE, "code": "REQUEST_TOO_LARGE"},
+                )
+        return message
+    
+    return bounded_receive
+
+
+class ValidationMiddleware:
     """Middleware for request and response validation.
     
     Validates:
     - Request size limits
     - Content-Type headers for JSON endpoints
-    - Request body size for JSON requests
+    - Request body size for JSON requests, as it is received
+    
+    Implemented as plain ASGI middleware: the checks only need the method,
+    path and two raw headers from the scope, so no Request object is built.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> JSONResponse:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and validate before passing to next handler."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
         # Skip validation for certain paths
-        skip_paths = {
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/health",
-            "/health/ready",
-            "/health/live",
-            "/health/metrics",
-        }
+        path = scope["path"]
+        if path in _SKIP_PATHS or path.startswith(_STATIC_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        
+        # ASGI header names are lowercase bytes; compare the raw values directly
+        content_length = None
+        content_type = b""
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+                if content_type:
+                    break
+            elif name == b"content-type":
+                content_type = value
+                if content_length is not None:
+                    break
+        
+        response = self._validate(scope["method"], content_length, content_type)
+        if response is not None:
+            await response(scope, receive, send)
+            return
         
-        if request.url.path in skip_paths or request.url.path.startswith("/static"):
-            return await call_next(request)
+        # Content-Length can be missing (chunked) or wrong, so also count the
+        # bytes actually received; multipart uploads are left unbounded
+        if not (content_type and _parse_content_type(content_type)[1]):
+            receive = _limit_body_size(receive)
         
+        # Process request
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            # Log unexpected errors
+            logger.error(f"Error processing request: {e}", exc_info=True)
+            raise
+    
+    def _validate(
+        self,
+        method: str,
+        content_length: Optional[bytes],
+        content_type: bytes,
+    ) -> Optional[OptimizedJSONResponse]:
+        """Return an error response if the request should be rejected, else None."""
         # Validate request size
-        content_length = request.headers.get("content-length")
+        size = None
         if content_length:
             try:
                 size = int(content_length)
-                if size > MAX_REQUEST_SIZE:
-                    return self._create_error_response(
-                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                        message=f"Request body too large. Maximum size is {MAX_REQUEST_SIZE / (1024 * 1024):.1f}MB",
-                        error_code="REQUEST_TOO_LARGE",
-                    )
             except ValueError:
                 # Invalid content-length header, but continue
-                logger.warning(f"Invalid content-length header: {content_length}")
+                logger.warning(f"Invalid content-length header: {content_length.decode('latin-1')}")
+        if size is not None and size > MAX_REQUEST_SIZE:
+            return self._create_error_response(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                message=_REQUEST_TOO_LARGE_MESSAGE,
+                error_code="REQUEST_TOO_LARGE",
+            )
         
         # Validate Content-Type for POST/PUT/PATCH requests with body
-        if request.method in ("POST", "PUT", "PATCH"):
-            content_type = request.headers.get("content-type", "").lower()
+        if method in ("POST", "PUT", "PATCH"):
+            # Fast path for the common, already-lowercase JSON header
+            if content_type == _JSON_CONTENT_TYPE or content_type.startswith(_JSON_CONTENT_TYPE_PREFIXES):
+                return None
+            
+            media_type, is_multipart = _parse_content_type(content_type)
             
             # Skip validation for multipart/form-data (file uploads)
-            if content_type.startswith("multipart/form-data"):
-                return await call_next(request)
+            if is_multipart:
+                return None
             
             # Validate JSON content type
-            if content_type and not any(
-                content_type.startswith(allowed) for allowed in ALLOWED_CONTENT_TYPES
-            ):
+            if media_type and media_type not in _JSON_MEDIA_TYPES:
                 # Allow empty content type for requests without body
-                if content_length and int(content_length) > 0:
+                if size:
                     return self._create_error_response(
                         status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                        message=f"Unsupported Content-Type: {content_type}. Expected: application/json",
+                        message=f"Unsupported Content-Type: {content_type.decode('latin-1')}. Expected: application/json",
                         error_code="UNSUPPORTED_MEDIA_TYPE",
                     )
         
-        # Process request
-        try:
-            response = await call_next(request)
-            return response
-        except Exception as e:
-            # Log unexpected errors
-            logger.error(f"Error processing request: {e}", exc_info=True)
-            raise
+        return None
     
     @staticmethod
     def _create_error_response(
         status_code: int,
         message: str,
         error_code: str,
-    ) -> JSONResponse:
+    ) -> OptimizedJSONResponse:
         """Create a standardized error response."""
-        error_response = ErrorResponse(
-            error=status.HTTP_STATUS_CODES.get(status_code, "error").lower().replace(" ", "_"),
+        return create_error_response(
+            error_type=_ERROR_TYPES.get(status_code, "error"),
             message=message,
-            code=error_code,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-        )
-        
-        return JSONResponse(
             status_code=status_code,
-            content=error_response.model_dump(exclude_none=True),
+            error_code=error_code,
         )
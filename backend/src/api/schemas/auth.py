@@ -1,5 +1,5 @@
 """Pydantic schemas for authentication."""
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ConfigDict
 from typing import Optional
 
 
@@ -10,15 +10,16 @@ class RegisterRequest(BaseModel):
     name: Optional[str] = None
     invitation_code: str  # Required invitation code
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "securepassword123",
                 "name": "John Doe",
                 "invitation_code": "abc123xyz...",
             }
-        }
+        },
+    )
 
 
 class LoginRequest(BaseModel):
@@ -26,25 +27,27 @@ class LoginRequest(BaseModel):
     email: EmailStr
     password: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "user@example.com",
                 "password": "securepassword123",
             }
-        }
+        },
+    )
 
 
 class RefreshTokenRequest(BaseModel):
     """Refresh token request schema."""
     refresh_token: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
             }
-        }
+        },
+    )
 
 
 class TokenResponse(BaseModel):
@@ -52,13 +55,14 @@ class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
                 "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
             }
-        }
+        },
+    )
 
 
 class UserResponse(BaseModel):
@@ -76,8 +80,7 @@ class UserResponse(BaseModel):
     is_active: bool
     role: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class AuthResponse(BaseModel):
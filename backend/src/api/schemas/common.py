@@ -0,0 +1,20 @@
+"""Shared Pydantic field types for API schemas."""
+from typing import Annotated, Literal
+from uuid import UUID
+from pydantic import PlainSerializer
+
+# UUID that dumps as a string in both python and JSON mode. The builtin str is
+# called directly by pydantic-core, with no per-model serializer method.
+StrUUID = Annotated[UUID, PlainSerializer(str, return_type=str, when_used="unless-none")]
+
+# Choice fields. Literal choices validate as a set lookup in pydantic-core
+# instead of a regex match.
+DocumentType = Literal["architecture", "adr", "notes"]
+ElementType = Literal["module", "feature", "component", "milestone", "technical_block", "decision_point"]
+ElementStatus = Literal["new", "in_progress", "tested", "done"]
+DependencyType = Literal["blocks", "requires", "related"]
+FeatureStatus = Literal["new", "in_progress", "done", "tested", "merged"]
+IdeaStatus = Literal["draft", "active", "archived"]
+ProjectStatus = Literal["active", "paused", "blocked", "completed", "archived"]
+TodoStatus = Literal["new", "in_progress", "done"]
+TodoPriority = Literal["low", "medium", "high", "critical"]
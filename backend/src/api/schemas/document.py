@@ -1,16 +1,14 @@
 """Pydantic schemas for documents."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
+from src.api.schemas.common import DocumentType
 
 
 class DocumentBase(BaseModel):
     """Base document schema."""
-    type: str = Field(
-        ...,
-        pattern="^(architecture|adr|notes)$",
-    )
+    type: DocumentType
     title: str = Field(..., min_length=1, max_length=255)
     content: str = Field(..., min_length=1)
     tags: List[str] = Field(default_factory=list)
@@ -42,8 +40,7 @@ class DocumentResponse(DocumentBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class DocumentListResponse(BaseModel):
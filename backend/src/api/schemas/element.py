@@ -1,19 +1,17 @@
 """Pydantic schemas for project elements."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
+from src.api.schemas.common import ElementType, ElementStatus, DependencyType
 
 
 class ElementBase(BaseModel):
     """Base element schema."""
-    type: str = Field(
-        ...,
-        pattern="^(module|feature|component|milestone|technical_block|decision_point)$",
-    )
+    type: ElementType
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    status: str = Field(default="new", pattern="^(new|in_progress|tested|done)$")
+    status: ElementStatus = "new"
     position: Optional[int] = None
     definition_of_done: Optional[str] = None
 
@@ -28,7 +26,7 @@ class ElementUpdate(BaseModel):
     """Schema for updating an element."""
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(new|in_progress|tested|done)$")
+    status: Optional[ElementStatus] = None
     position: Optional[int] = None
     definition_of_done: Optional[str] = None
     parent_id: Optional[UUID] = None
@@ -46,16 +44,14 @@ class ElementResponse(ElementBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class ElementTreeResponse(ElementResponse):
     """Schema for element with children tree."""
     children: List["ElementTreeResponse"] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class ElementWithTodosResponse(ElementResponse):
@@ -67,7 +63,7 @@ class ElementWithTodosResponse(ElementResponse):
 class DependencyCreate(BaseModel):
     """Schema for creating a dependency."""
     depends_on_element_id: UUID
-    dependency_type: str = Field(..., pattern="^(blocks|requires|related)$")
+    dependency_type: DependencyType
 
 
 class DependencyResponse(BaseModel):
@@ -78,5 +74,4 @@ class DependencyResponse(BaseModel):
     dependency_type: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -1,6 +1,6 @@
 """Error response schemas for standardized API error handling."""
 from typing import Optional, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class ErrorDetail(BaseModel):
@@ -21,8 +21,8 @@ class ErrorResponse(BaseModel):
     code: Optional[str] = Field(None, description="Error code for programmatic handling")
     timestamp: Optional[str] = Field(None, description="Error timestamp (ISO format)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "validation_error",
                 "message": "Invalid input data",
@@ -36,7 +36,8 @@ class ErrorResponse(BaseModel):
                 "code": "VALIDATION_ERROR",
                 "timestamp": "2024-01-01T12:00:00Z"
             }
-        }
+        },
+    )
 
 
 class SuccessResponse(BaseModel):
@@ -45,11 +46,12 @@ class SuccessResponse(BaseModel):
     message: Optional[str] = Field(None, description="Success message")
     data: Optional[Any] = Field(None, description="Response data")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Operation completed successfully",
                 "data": {}
             }
-        }
+        },
+    )
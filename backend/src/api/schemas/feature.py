@@ -1,15 +1,16 @@
 """Pydantic schemas for features."""
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
+from src.api.schemas.common import FeatureStatus, StrUUID
 
 
 class FeatureBase(BaseModel):
     """Base feature schema."""
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    status: str = Field(default="new", pattern="^(new|in_progress|done|tested|merged)$")
+    status: FeatureStatus = "new"
     assigned_to: Optional[UUID] = None
 
 
@@ -23,29 +24,24 @@ class FeatureUpdate(BaseModel):
     """Schema for updating a feature."""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(new|in_progress|done|tested|merged)$")
+    status: Optional[FeatureStatus] = None
     assigned_to: Optional[UUID] = None
 
 
 class FeatureResponse(FeatureBase):
     """Schema for feature response."""
-    id: UUID
-    project_id: UUID
+    id: StrUUID
+    project_id: StrUUID
+    assigned_to: Optional[StrUUID] = None
     progress_percentage: int
     total_todos: int
     completed_todos: int
-    created_by: Optional[UUID] = None
-    updated_by: Optional[UUID] = None
+    created_by: Optional[StrUUID] = None
+    updated_by: Optional[StrUUID] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-    
-    @field_serializer('id', 'project_id', 'created_by', 'updated_by', 'assigned_to')
-    def serialize_uuid(self, value: UUID | str | None, _info) -> str | None:
-        """Serialize UUID to string."""
-        return str(value) if isinstance(value, UUID) else value
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class FeatureListResponse(BaseModel):
@@ -1,15 +1,16 @@
 """Pydantic schemas for ideas."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
+from src.api.schemas.common import IdeaStatus, ProjectStatus
 
 
 class IdeaBase(BaseModel):
     """Base idea schema."""
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    status: str = Field(default="draft", pattern="^(draft|active|archived)$")
+    status: IdeaStatus = "draft"
     tags: Optional[List[str]] = Field(default_factory=list)
 
 
@@ -22,7 +23,7 @@ class IdeaUpdate(BaseModel):
     """Schema for updating an idea."""
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(draft|active|archived)$")
+    status: Optional[IdeaStatus] = None
     tags: Optional[List[str]] = None
 
 
@@ -36,8 +37,7 @@ class IdeaResponse(IdeaBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class IdeaListResponse(BaseModel):
@@ -52,6 +52,6 @@ class IdeaConvertRequest(BaseModel):
     """Schema for converting idea to project."""
     project_name: Optional[str] = Field(None, min_length=1, max_length=255)
     project_description: Optional[str] = None
-    project_status: str = Field(default="active", pattern="^(active|paused|blocked|completed|archived)$")
+    project_status: ProjectStatus = "active"
     project_tags: Optional[List[str]] = Field(default_factory=list)
     technology_tags: Optional[List[str]] = Field(default_factory=list)
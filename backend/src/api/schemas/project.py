@@ -1,15 +1,16 @@
 """Pydantic schemas for projects."""
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
+from src.api.schemas.common import ProjectStatus, StrUUID
 
 
 class ProjectBase(BaseModel):
     """Base project schema."""
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    status: str = Field(default="active", pattern="^(active|paused|blocked|completed|archived)$")
+    status: ProjectStatus = "active"
     tags: Optional[List[str]] = Field(default_factory=list)
     technology_tags: Optional[List[str]] = Field(default_factory=list)
     cursor_instructions: Optional[str] = None
@@ -26,7 +27,7 @@ class ProjectUpdate(BaseModel):
     """Schema for updating a project."""
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(active|paused|blocked|completed|archived)$")
+    status: Optional[ProjectStatus] = None
     tags: Optional[List[str]] = None
     technology_tags: Optional[List[str]] = None
     cursor_instructions: Optional[str] = None
@@ -38,24 +39,16 @@ class ProjectUpdate(BaseModel):
 
 class ProjectResponse(ProjectBase):
     """Schema for project response."""
-    id: UUID
-    team_id: UUID
-    created_by: Optional[UUID] = None
-    updated_by: Optional[UUID] = None
+    id: StrUUID
+    team_id: StrUUID
+    created_by: Optional[StrUUID] = None
+    updated_by: Optional[StrUUID] = None
     created_at: datetime
     updated_at: datetime
     last_session_at: Optional[datetime] = None
     resume_context: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
-
-    @field_serializer('id', 'team_id', 'created_by', 'updated_by')
-    def serialize_uuid(self, value: UUID | str | None, _info) -> Optional[str]:
-        """Serialize UUID to string."""
-        if value is None:
-            return None
-        return str(value) if isinstance(value, UUID) else value
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class ProjectListResponse(BaseModel):
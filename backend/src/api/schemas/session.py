@@ -1,5 +1,5 @@
 """Pydantic schemas for sessions."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -42,8 +42,7 @@ class SessionResponse(SessionBase):
     elements_updated: List[UUID] = Field(default_factory=list)
     notes: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
 
 
 class SessionListResponse(BaseModel):
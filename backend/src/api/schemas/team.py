@@ -1,5 +1,5 @@
 """Team schemas."""
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -10,13 +10,14 @@ class TeamCreateRequest(BaseModel):
     name: str
     description: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Development Team",
                 "description": "Main development team",
             }
-        }
+        },
+    )
 
 
 class TeamUpdateRequest(BaseModel):
@@ -24,32 +25,27 @@ class TeamUpdateRequest(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "Updated Team Name",
                 "description": "Updated description",
             }
-        }
+        },
+    )
 
 
 class TeamMemberResponse(BaseModel):
     """Team member response schema."""
-    id: str
-    team_id: str
-    user_id: str
+    id: UUID
+    team_id: UUID
+    user_id: UUID
     role: str
     joined_at: datetime
     user_name: Optional[str] = None
     user_email: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
-    @field_serializer('id', 'team_id', 'user_id')
-    def serialize_uuid(self, value: UUID | str, _info) -> str:
-        """Serialize UUID to string."""
-        return str(value) if isinstance(value, UUID) else value
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class TeamMemberListResponse(BaseModel):
@@ -58,37 +54,33 @@ class TeamMemberListResponse(BaseModel):
     total: int
     page: int = Field(..., description="Current page number (1-indexed)")
     page_size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
 
 
 class TeamResponse(BaseModel):
     """Team response schema."""
-    id: str
+    id: UUID
     name: str
     description: Optional[str]
     language: Optional[str] = None  # 'hu' (Hungarian) or 'en' (English)
-    created_by: str
+    created_by: UUID
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
-    @field_serializer('id', 'created_by')
-    def serialize_uuid(self, value: UUID | str, _info) -> str:
-        """Serialize UUID to string."""
-        return str(value) if isinstance(value, UUID) else value
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class TeamLanguageRequest(BaseModel):
     """Team language configuration request schema."""
     language: str  # 'hu' (Hungarian) or 'en' (English)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "language": "hu",
             }
-        }
+        },
+    )
 
 
 class TeamListResponse(BaseModel):
@@ -97,14 +89,15 @@ class TeamListResponse(BaseModel):
     total: int
     page: Optional[int] = Field(None, description="Current page number (1-indexed)")
     page_size: Optional[int] = Field(None, description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if there may be one")
 
 
 class TeamInvitationResponse(BaseModel):
     """Team invitation response schema."""
     code: str
     type: str
-    team_id: Optional[str]
-    expires_at: Optional[str]
-    created_at: str
+    team_id: Optional[UUID]
+    expires_at: Optional[datetime]
+    created_at: datetime
     email_sent_to: Optional[str] = None
-    email_sent_at: Optional[str] = None
\ No newline at end of file
+    email_sent_at: Optional[datetime] = None
\ No newline at end of file
@@ -1,17 +1,18 @@
 """Pydantic schemas for todos."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
+from src.api.schemas.common import TodoStatus, TodoPriority
 
 
 class TodoBase(BaseModel):
     """Base todo schema."""
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
-    status: str = Field(default="new", pattern="^(new|in_progress|done)$")
+    status: TodoStatus = "new"
     position: Optional[int] = None
-    priority: Optional[str] = Field(default="medium", pattern="^(low|medium|high|critical)$")
+    priority: Optional[TodoPriority] = "medium"
     blocker_reason: Optional[str] = None
     assigned_to: Optional[UUID] = None
 
@@ -27,9 +28,9 @@ class TodoUpdate(BaseModel):
     """Schema for updating a todo."""
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(new|in_progress|done)$")
+    status: Optional[TodoStatus] = None
     position: Optional[int] = None
-    priority: Optional[str] = Field(None, pattern="^(low|medium|high|critical)$")
+    priority: Optional[TodoPriority] = None
     blocker_reason: Optional[str] = None
     assigned_to: Optional[UUID] = None
     feature_id: Optional[UUID] = None
@@ -50,8 +51,7 @@ class TodoResponse(TodoBase):
     updated_at: datetime
     completed_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class TodoListResponse(BaseModel):
@@ -60,3 +60,4 @@ class TodoListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # Only for assigned-todo listings
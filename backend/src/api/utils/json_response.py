@@ -1,6 +1,7 @@
 """Optimized JSON response utilities using orjson for faster serialization."""
 from fastapi.responses import Response
 import orjson
+from pydantic import BaseModel
 from typing import Any
 
 
@@ -35,3 +36,24 @@ class OptimizedJSONResponse(Response):
             content,
             option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SERIALIZE_UUID
         )
+
+
+def validated_json_response(model: type[BaseModel], data: Any) -> Response:
+    """Validate data against a response schema and return it as JSON bytes.
+    
+    Validation (reading ORM rows via attributes) and JSON encoding each run as
+    one pydantic-core call, instead of FastAPI re-validating the returned
+    model against response_model and passing it through jsonable_encoder.
+    Keep response_model on the route so the OpenAPI schema is unchanged.
+    
+    Args:
+        model: Response schema, e.g. FeatureListResponse
+        data: Dict or object matching the schema; nested rows may be ORM objects
+    
+    Returns:
+        application/json Response with the serialized body
+    """
+    return Response(
+        model.model_validate(data, from_attributes=True).model_dump_json(),
+        media_type="application/json",
+    )
@@ -50,6 +50,11 @@ class Settings(BaseSettings):
         default="7d",
         description="JWT refresh token expiration time (e.g., '15m', '1h', '7d')",
     )
+    JWT_VERIFY_CACHE_TTL: int = Field(
+        default=5,
+        ge=0,
+        description="Seconds a verified access token is cached in-process (0 disables)",
+    )
 
     # ==================== GitHub ====================
     GITHUB_TOKEN: Optional[str] = Field(
@@ -57,6 +57,11 @@ class User(Base):
     created_invitations = relationship("InvitationCode", foreign_keys="InvitationCode.created_by", back_populates="creator")
     mcp_api_keys = relationship("McpApiKey", foreign_keys="McpApiKey.user_id", back_populates="user")
 
+    __table_args__ = (
+        # Case-insensitive email lookups (func.lower(User.email) == ...)
+        Index("idx_users_email_lower", func.lower(email)),
+    )
+
 
 class Project(Base):
     """Project model."""
@@ -285,6 +290,7 @@ class Todo(Base):
         Index("idx_todos_feature", "feature_id"),
         Index("idx_todos_status", "status"),
         Index("idx_todos_assigned", "assigned_to"),
+        Index("idx_todos_assigned_created", "assigned_to", "created_at", "id"),
         Index("idx_todos_created_by", "created_by"),
     )
 
@@ -455,6 +461,7 @@ class Team(Base):
 
     __table_args__ = (
         Index("idx_teams_created_by", "created_by"),
+        Index("idx_teams_created_id", "created_at", "id"),  # Keyset pagination
     )
 
 
@@ -476,6 +483,7 @@ class TeamMember(Base):
         UniqueConstraint("team_id", "user_id"),
         Index("idx_team_members_team", "team_id"),
         Index("idx_team_members_user", "user_id"),
+        Index("idx_team_members_team_joined", "team_id", "joined_at", "id"),  # Keyset pagination
     )
 
 
@@ -1,5 +1,5 @@
 """FastAPI application entry point."""
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.responses import Response
@@ -9,30 +9,18 @@ from contextlib import asynccontextmanager
 import os
 import logging
 from pathlib import Path
-from src.api.controllers import (
-    auth_controller,
-    project_controller,
-    feature_controller,
-    todo_controller,
-    element_controller,
-    session_controller,
-    document_controller,
-    github_controller,
-    idea_controller,
-    signalr_controller,
-    mcp_controller,
-    admin_controller,
-    team_controller,
-    mcp_key_controller,
-    audit_controller,
-    task_queue_controller,
-    api_info_controller,
-)
+from src.api.controllers import api_info_controller
+
+from src.api.utils.json_response import OptimizedJSONResponse
+from src.utils.fastapi_compat import install_dependency_introspection_cache
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Dependency callables never change after startup; skip re-inspecting them per request
+install_dependency_introspection_cache()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -61,6 +49,27 @@ async def lifespan(app: FastAPI):
         # Don't fail startup if migrations fail - might be a temporary issue
         # The app will still start, but database operations might fail
     
+    # Startup: Open the pool's connections before the first requests arrive
+    try:
+        import asyncio
+        from src.database.base import warm_pool
+
+        opened = await asyncio.to_thread(warm_pool)
+        logger.info(f"Database connection pool warmed with {opened} connection(s)")
+    except Exception as e:
+        logger.warning(f"Failed to warm database connection pool: {e}")
+
+    # Sync handlers and get_db run in the threadpool; a smaller pool makes them queue on checkout
+    from anyio.to_thread import current_default_thread_limiter
+    from src.database.base import pool_capacity
+
+    threads = current_default_thread_limiter().total_tokens
+    if settings.is_production() and pool_capacity() < threads:
+        logger.warning(
+            f"Database pool capacity ({pool_capacity()}) is below the request threadpool size "
+            f"({threads}); requests may wait for a connection"
+        )
+    
     # Startup: Start SignalR connection cleanup task
     cleanup_task = None
     try:
@@ -252,6 +261,11 @@ else:
         # Use explicit origin list (comma-separated)
         cors_origins = [origin.strip() for origin in settings.CORS_ORIGIN.split(",")]
 
+# Request size and Content-Type checks (added first so it runs innermost, and
+# its rejections still get the security, timing and CORS handling below)
+from src.api.middleware.validation import ValidationMiddleware
+app.add_middleware(ValidationMiddleware)
+
 # Security headers middleware (add before CORS)
 from src.api.middleware.security_headers import SecurityHeadersMiddleware
 app.add_middleware(SecurityHeadersMiddleware)
@@ -260,6 +274,10 @@ app.add_middleware(SecurityHeadersMiddleware)
 from src.api.middleware.performance import PerformanceMiddleware
 app.add_middleware(PerformanceMiddleware)
 
+# Per-request memoization of authorization checks (see src/utils/request_cache.py)
+from src.api.middleware.request_cache import RequestCacheMiddleware
+app.add_middleware(RequestCacheMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -273,28 +291,14 @@ app.add_middleware(
 app.include_router(api_info_controller.router)
 
 # Include versioned API routes
-from src.api.routes.v1 import v1_router
+from src.api.routes.v1 import API_ROUTERS, v1_router
 app.include_router(v1_router)
 
 # Include legacy routes (without version prefix) for backward compatibility
 # These will be deprecated in a future version
 # TODO: Remove legacy routes after migration period
-app.include_router(auth_controller.router)
-app.include_router(project_controller.router)
-app.include_router(feature_controller.router)
-app.include_router(todo_controller.router)
-app.include_router(element_controller.router)
-app.include_router(session_controller.router)
-app.include_router(document_controller.router)
-app.include_router(github_controller.router)
-app.include_router(idea_controller.router)
-app.include_router(signalr_controller.router)
-app.include_router(mcp_controller.router)
-app.include_router(admin_controller.router)
-app.include_router(team_controller.router)
-app.include_router(mcp_key_controller.router)
-app.include_router(audit_controller.router)
-app.include_router(task_queue_controller.router)
+for router in API_ROUTERS:
+    app.include_router(router)
 
 
 @app.get("/health")
@@ -405,9 +409,6 @@ async def global_exception_handler(request, exc):
     NOTE: For ASGI apps (like MCP transport) that handle their own responses,
     we need to be careful not to send duplicate responses.
     """
-    from fastapi import HTTPException
-    import logging
-    
     # Don't handle HTTPException - FastAPI already handles those
     if isinstance(exc, HTTPException):
         raise exc
@@ -415,16 +416,14 @@ async def global_exception_handler(request, exc):
     # Don't handle RuntimeError about response already sent - this happens with ASGI apps
     # that handle their own responses (like MCP transport)
     if isinstance(exc, RuntimeError) and "response already" in str(exc).lower():
-        logging.warning(f"RuntimeError: Response already sent (likely from ASGI app): {exc}")
+        logger.warning("RuntimeError: Response already sent (likely from ASGI app): %s", exc)
         # Don't try to send response - it was already sent by the ASGI app
         # Return None to indicate we handled it (but didn't send a response)
         return None
     
     # Handle all other exceptions
     # Always log the error for debugging
-    logging.error(f"Unhandled exception: {exc}", exc_info=True)
-    
-    from src.api.utils.json_response import OptimizedJSONResponse
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     
     return OptimizedJSONResponse(
         status_code=500,
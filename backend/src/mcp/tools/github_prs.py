@@ -82,6 +82,7 @@ async def handle_link_todo_to_pr(todo_id: str, pr_number: int) -> dict:
         db.refresh(todo)
 
         # Invalidate cache
+        cache_service.delete(f"todo:{todo_id}")
         cache_service.delete(f"project:{project.id}:*")
 
         return {
@@ -244,6 +245,7 @@ async def handle_create_github_pr(
                         todo.github_pr_number = pr.number
                         todo.github_pr_url = pr.html_url
                         db.commit()
+                        cache_service.delete(f"todo:{todo_id}")
 
             # Invalidate cache
             cache_service.delete(f"project:{project_id}:*")
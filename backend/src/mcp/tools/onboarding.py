@@ -1,4 +1,5 @@
 """MCP Tools for user onboarding."""
+import asyncio
 from datetime import datetime
 from mcp.types import Tool as MCPTool
 from sqlalchemy.orm import Session
@@ -54,10 +55,13 @@ async def handle_verify_connection() -> dict:
         db.commit()
         db.refresh(user)
         
-        # Broadcast SignalR event for real-time frontend update
-        await broadcast_mcp_verified(
-            str(user_id),
-            user.mcp_verified_at.isoformat() if user.mcp_verified_at else None
+        # Broadcast SignalR event for real-time frontend update (fire and forget,
+        # so the tool response does not wait for the socket fan-out)
+        asyncio.create_task(
+            broadcast_mcp_verified(
+                str(user_id),
+                user.mcp_verified_at.isoformat() if user.mcp_verified_at else None
+            )
         )
         
         return {
@@ -0,0 +1,84 @@
+"""In-process caches for the authentication dependencies.
+
+Access tokens are verified on every authenticated request. Successful
+verifications are kept briefly, keyed by a hash of the token (never the token
+itself), so repeat requests with the same token skip the signature check.
+Failed verifications are never cached, and an entry never outlives the token.
+
+The user's role and active flag are cached per user id so authenticated
+requests don't query the users table each time. Code that changes a user's
+role or active flag, or deletes the user, calls invalidate_user_auth.
+"""
+import hashlib
+import time
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
+from src.config import settings
+from src.database.base import SessionLocal
+from src.database.models import User
+from src.services.auth_service import auth_service
+
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: dict[bytes, tuple[float, dict]] = {}
+
+USER_AUTH_CACHE_TTL = 30  # seconds; bounds staleness in other worker processes
+USER_AUTH_CACHE_MAXSIZE = 5_000
+_user_auth_cache: dict[UUID, tuple[float, tuple[str, bool]]] = {}
+# Column-only statement built once, so misses reuse the cached compiled SQL
+_USER_AUTH_STMT = select(User.role, User.is_active).where(User.id == bindparam("user_id"))
+
+
+def verify_access_token(token: str) -> dict:
+    """Verify an access token, reusing a recent successful verification.
+
+    Raises:
+        ValueError: If the token is invalid or expired
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    entry = _token_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    payload = auth_service.verify_token(token, is_refresh=False)
+    expires_at = min(now + settings.JWT_VERIFY_CACHE_TTL, payload.get("exp", now))
+    if expires_at > now:
+        if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+            _token_cache.clear()
+        _token_cache[key] = (expires_at, payload)
+    return payload
+
+
+def get_user_auth(user_id: UUID, db: Optional[Session] = None) -> Optional[tuple[str, bool]]:
+    """Return (role, is_active) for a user, or None if the user doesn't exist.
+
+    A session is only needed on a cache miss; without db, a short-lived one is
+    opened for the lookup.
+    """
+    now = time.time()
+    entry = _user_auth_cache.get(user_id)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    if db is None:
+        with SessionLocal() as session:
+            row = session.execute(_USER_AUTH_STMT, {"user_id": user_id}).first()
+    else:
+        row = db.execute(_USER_AUTH_STMT, {"user_id": user_id}).first()
+    if row is None:
+        _user_auth_cache.pop(user_id, None)
+        return None
+
+    role, is_active = row
+    user_auth = (role, is_active)
+    if len(_user_auth_cache) >= USER_AUTH_CACHE_MAXSIZE:
+        _user_auth_cache.clear()
+    _user_auth_cache[user_id] = (now + USER_AUTH_CACHE_TTL, user_auth)
+    return user_auth
+
+
+def invalidate_user_auth(user_id: UUID) -> None:
+    """Drop a user's cached role and active flag in this process."""
+    _user_auth_cache.pop(user_id, None)
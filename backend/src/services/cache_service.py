@@ -21,6 +21,12 @@ _redis_client: Optional[redis.Redis] = None
 # Standardized TTL constants (in seconds)
 class CacheTTL:
     """Standard TTL values for different cache types."""
+    # Polled API responses (dashboards re-request the same list every few seconds)
+    RESPONSE = 10  # 10 seconds - freshness window for cached GET responses
+
+    # Very short-lived caches (aggregate counts behind paginated lists)
+    VERY_SHORT = 30  # 30 seconds - for list totals
+
     # Short-lived caches (frequently changing data)
     SHORT = 60  # 1 minute - for resume context, active todos
     
@@ -90,21 +90,26 @@ class ElementService:
     ) -> List[dict]:
         """Build hierarchical element tree with statistics.
         
-        Optimized to avoid N+1 queries by using bulk queries with aggregation.
+        Loads every element of the project and its todo/feature statistics in
+        a fixed number of queries, then links children to parents through a
+        parent_id -> children map instead of querying each level recursively.
         """
-        from src.database.models import Todo, FeatureElement, Feature
-        from sqlalchemy import func, case
+        from src.database.models import FeatureElement, Feature
+        from sqlalchemy import case, select
 
-        elements = ElementService.get_project_elements_tree(db, project_id, parent_id)
+        elements = (
+            db.query(ProjectElement)
+            .filter(ProjectElement.project_id == project_id)
+            .order_by(ProjectElement.position, ProjectElement.created_at)
+            .all()
+        )
         
         if not elements:
             return []
         
-        element_ids = [e.id for e in elements]
-        result = []
+        project_element_ids = select(ProjectElement.id).where(ProjectElement.project_id == project_id)
 
-        # OPTIMIZATION: Bulk query todos counts for all elements at once
-        # Group by element_id and count todos and done todos
+        # Todo counts and done counts per element
         todos_stats = (
             db.query(
                 Todo.element_id,
@@ -113,52 +118,31 @@ class ElementService:
                     case((Todo.status == "done", 1), else_=0)
                 ).label('todos_done_count')
             )
-            .filter(Todo.element_id.in_(element_ids))
+            .filter(Todo.element_id.in_(project_element_ids))
             .group_by(Todo.element_id)
             .all()
         )
-        
-        # Create a dict for quick lookup: element_id -> (todos_count, todos_done_count)
         todos_dict = {
             eid: (count, done_count or 0)
             for eid, count, done_count in todos_stats
         }
 
-        # OPTIMIZATION: Bulk query feature counts for all elements at once
-        features_counts = (
-            db.query(
-                FeatureElement.element_id,
-                func.count(FeatureElement.feature_id).label('features_count')
-            )
-            .filter(FeatureElement.element_id.in_(element_ids))
-            .group_by(FeatureElement.element_id)
-            .all()
-        )
-        
-        # Create a dict for quick lookup: element_id -> features_count
-        features_count_dict = {
-            eid: count for eid, count in features_counts
-        }
-
-        # OPTIMIZATION: Bulk query linked features for all elements at once
-        linked_features_query = (
+        # Feature counts and linked feature names per element
+        linked_features = (
             db.query(FeatureElement.element_id, Feature.name)
             .join(Feature, FeatureElement.feature_id == Feature.id)
-            .filter(FeatureElement.element_id.in_(element_ids))
-                .all()
-            )
-        
-        # Create a dict for quick lookup: element_id -> [feature_names]
+            .filter(FeatureElement.element_id.in_(project_element_ids))
+            .all()
+        )
         linked_features_dict = {}
-        for eid, feature_name in linked_features_query:
-            if eid not in linked_features_dict:
-                linked_features_dict[eid] = []
-            linked_features_dict[eid].append(feature_name)
+        for eid, feature_name in linked_features:
+            linked_features_dict.setdefault(eid, []).append(feature_name)
 
-        # Build result using pre-fetched data
+        # Elements arrive in (position, created_at) order, so each children
+        # list keeps the per-level ordering
+        children_by_parent = {}
         for element in elements:
             todos_count, todos_done_count = todos_dict.get(element.id, (0, 0))
-            features_count = features_count_dict.get(element.id, 0)
             linked_feature_names = linked_features_dict.get(element.id, [])
 
             element_dict = {
@@ -174,13 +158,13 @@ class ElementService:
                 "updated_at": element.updated_at.isoformat(),
                 "todos_count": todos_count,
                 "todos_done_count": todos_done_count,
-                "features_count": features_count,
+                "features_count": len(linked_feature_names),
                 "linked_features": linked_feature_names,
-                "children": ElementService.build_element_tree(db, project_id, element.id),
+                "children": children_by_parent.setdefault(element.id, []),
             }
-            result.append(element_dict)
+            children_by_parent.setdefault(element.parent_id, []).append(element_dict)
 
-        return result
+        return children_by_parent.get(parent_id, [])
 
     @staticmethod
     def get_element_with_todos(
@@ -80,6 +80,28 @@ class FeatureService:
         """Get feature by ID."""
         return db.query(Feature).filter(Feature.id == feature_id).first()
 
+    @staticmethod
+    def get_feature_with_progress(db: Session, feature_id: UUID) -> tuple[Optional[Feature], int]:
+        """Get feature by ID together with its todo completion percentage.
+
+        Reads the feature and aggregates its todos in a single query; nothing is written.
+        """
+        row = (
+            db.query(
+                Feature,
+                func.count(Todo.id).label("total"),
+                func.count(Todo.id).filter(Todo.status == "done").label("completed"),
+            )
+            .outerjoin(Todo, Todo.feature_id == Feature.id)
+            .filter(Feature.id == feature_id)
+            .group_by(Feature.id)
+            .first()
+        )
+        if not row:
+            return None, 0
+        feature, total, completed = row
+        return feature, int((completed / total * 100)) if total > 0 else 0
+
     @staticmethod
     def get_features_by_project(
         db: Session,
@@ -225,13 +247,16 @@ class FeatureService:
         if not feature:
             return {"total": 0, "completed": 0, "percentage": 0}
 
-        # Count todos
+        # Count todos in one pass
         # Completed todos are only those with 'done' status (simplified workflow)
-        total = db.query(func.count(Todo.id)).filter(Todo.feature_id == feature_id).scalar()
-        completed = (
-            db.query(func.count(Todo.id))
-            .filter(Todo.feature_id == feature_id, Todo.status == "done")
-            .scalar()
+        total, completed, in_progress_count = (
+            db.query(
+                func.count(Todo.id),
+                func.count(Todo.id).filter(Todo.status == "done"),
+                func.count(Todo.id).filter(Todo.status == "in_progress"),
+            )
+            .filter(Todo.feature_id == feature_id)
+            .one()
         )
 
         percentage = int((completed / total * 100)) if total > 0 else 0
@@ -246,17 +271,6 @@ class FeatureService:
         # - Todos: new → in_progress → done (simplified)
         # - Features: new → in_progress → done → tested → merged (feature-level testing and merging)
         if total > 0:
-            in_progress_count = (
-                db.query(func.count(Todo.id))
-                .filter(Todo.feature_id == feature_id, Todo.status == "in_progress")
-                .scalar()
-            )
-            done_count = (
-                db.query(func.count(Todo.id))
-                .filter(Todo.feature_id == feature_id, Todo.status == "done")
-                .scalar()
-            )
-            
             if completed == total:
                 # All todos are done - feature can be marked as done
                 # Note: tested/merged status should be set manually after testing/merging
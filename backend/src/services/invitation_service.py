@@ -4,8 +4,8 @@ from uuid import UUID
 from datetime import datetime, timedelta
 import secrets
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from src.database.models import InvitationCode, User, Team
+from sqlalchemy import and_, func, select
+from src.database.models import InvitationCode, User, Team, TeamMember
 
 
 class InvitationService:
@@ -147,6 +147,33 @@ class InvitationService:
         """Get invitation by code."""
         return db.query(InvitationCode).filter(InvitationCode.code == code).first()
 
+    @staticmethod
+    def lookup_invitee(
+        db: Session,
+        team_id: UUID,
+        email: str,
+    ) -> tuple[Optional[User], bool]:
+        """Find an existing user by email and whether they already belong to the team.
+
+        Single round trip: the user row is LEFT JOINed with their membership in
+        the team. Matching on lower(email) uses idx_users_email_lower.
+
+        Returns:
+            (user, is_already_member) - (None, False) if no user has that email
+        """
+        stmt = (
+            select(User, TeamMember.id)
+            .outerjoin(
+                TeamMember,
+                and_(TeamMember.user_id == User.id, TeamMember.team_id == team_id),
+            )
+            .where(func.lower(User.email) == email.lower())
+        )
+        row = db.execute(stmt).first()
+        if row is None:
+            return None, False
+        return row[0], row[1] is not None
+
     @staticmethod
     def get_invitations_by_creator(
         db: Session,
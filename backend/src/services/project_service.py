@@ -240,16 +240,45 @@ class ProjectService:
         Users have access if they are members of the team that owns the project.
         Team leaders have full access to their team's projects.
         Regular members have access to their team's projects.
+
+        The user's effective role on the project is cached in Redis for a short
+        time (user:{user_id}:project:{project_id}); team membership changes and
+        project updates invalidate it.
         """
+        cache_key = f"user:{user_id}:project:{project_id}"
+        access_role = CacheService.get_cache(cache_key)
+        if access_role is None:
+            access_role = ProjectService._get_access_role(db, user_id, project_id)
+            CacheService.set_cache(cache_key, access_role, ttl=CacheTTL.VERY_SHORT)
+
+        if access_role == "none":
+            return False
+        if access_role == "admin":
+            return True
+        
+        # If required_role is specified, check role hierarchy
+        # For now, team_leader has full access, members have read access
+        if required_role:
+            if access_role == "team_leader":
+                return True  # Team leaders have full access
+            elif required_role in ["viewer", "editor", "owner"]:
+                # Members can view, but not edit
+                return required_role == "viewer"
+        
+        return True
+
+    @staticmethod
+    def _get_access_role(db: Session, user_id: UUID, project_id: UUID) -> str:
+        """Resolve a user's role on a project: 'admin', their team role, or 'none'."""
         # Get project
         project = db.query(Project).filter(Project.id == project_id).first()
         if not project:
-            return False
+            return "none"
         
         # Check if user is admin - admins have access to all projects
         user = db.query(User).filter(User.id == user_id).first()
         if user and user.role == "admin":
-            return True
+            return "admin"
         
         # Check if user is a member of the team that owns the project
         team_member = (
@@ -260,20 +289,7 @@ class ProjectService:
             )
             .first()
         )
-        
-        if not team_member:
-            return False
-        
-        # If required_role is specified, check role hierarchy
-        # For now, team_leader has full access, members have read access
-        if required_role:
-            if team_member.role == "team_leader":
-                return True  # Team leaders have full access
-            elif required_role in ["viewer", "editor", "owner"]:
-                # Members can view, but not edit
-                return required_role == "viewer"
-        
-        return True
+        return team_member.role if team_member else "none"
 
     @staticmethod
     def get_or_create_default_element(
@@ -20,6 +20,9 @@ from .message_handler import handle_message
 from .broadcast_handlers import (
     broadcast_todo_update,
     broadcast_feature_update,
+    broadcast_batch,
+    todo_updated_message,
+    feature_updated_message,
     broadcast_project_update,
     broadcast_session_start,
     broadcast_session_end,
@@ -38,6 +41,9 @@ __all__ = [
     # Broadcast handlers
     "broadcast_todo_update",
     "broadcast_feature_update",
+    "broadcast_batch",
+    "todo_updated_message",
+    "feature_updated_message",
     "broadcast_project_update",
     "broadcast_session_start",
     "broadcast_session_end",
@@ -4,10 +4,9 @@ from uuid import UUID
 from .connection_manager import connection_manager
 
 
-async def broadcast_todo_update(project_id: str, todo_id: str, user_id: UUID, changes: dict):
-    """Broadcast todo update to project group."""
-    # SignalR message format
-    message = {
+def todo_updated_message(project_id: str, todo_id: str, user_id: UUID, changes: dict) -> dict:
+    """Build the todoUpdated SignalR invocation."""
+    return {
         "type": 1,  # SignalR invocation
         "target": "todoUpdated",
         "arguments": [{
@@ -17,13 +16,11 @@ async def broadcast_todo_update(project_id: str, todo_id: str, user_id: UUID, ch
             "changes": changes
         }]
     }
-    await connection_manager.broadcast_to_project(project_id, message)
 
 
-async def broadcast_feature_update(project_id: str, feature_id: str, progress: int, status: Optional[str] = None):
-    """Broadcast feature progress and status update to project group."""
-    # SignalR message format
-    message = {
+def feature_updated_message(project_id: str, feature_id: str, progress: int, status: Optional[str] = None) -> dict:
+    """Build the featureUpdated SignalR invocation."""
+    return {
         "type": 1,  # SignalR invocation
         "target": "featureUpdated",
         "arguments": [{
@@ -33,9 +30,25 @@ async def broadcast_feature_update(project_id: str, feature_id: str, progress: i
             "status": status
         }]
     }
+
+
+async def broadcast_todo_update(project_id: str, todo_id: str, user_id: UUID, changes: dict):
+    """Broadcast todo update to project group."""
+    message = todo_updated_message(project_id, todo_id, user_id, changes)
+    await connection_manager.broadcast_to_project(project_id, message)
+
+
+async def broadcast_feature_update(project_id: str, feature_id: str, progress: int, status: Optional[str] = None):
+    """Broadcast feature progress and status update to project group."""
+    message = feature_updated_message(project_id, feature_id, progress, status)
     await connection_manager.broadcast_to_project(project_id, message)
 
 
+async def broadcast_batch(project_id: str, messages: list):
+    """Broadcast several messages (e.g. a todo and its feature's progress) to a project group in one frame."""
+    await connection_manager.broadcast_batch_to_project(project_id, messages)
+
+
 async def broadcast_project_update(project_id: str, changes: dict):
     """Broadcast project update to project group.
     
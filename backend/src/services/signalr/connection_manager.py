@@ -1,14 +1,22 @@
 """Connection manager for SignalR WebSocket connections."""
-import json
 import asyncio
 import logging
 import time
 from typing import Dict, Set, Optional
 from uuid import UUID, uuid4
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# SignalR protocol requires record separator (0x1E) after each message
+RECORD_SEPARATOR = '\x1E'
+
+
+def encode_frame(message: dict) -> str:
+    """Serialize a message into a SignalR JSON protocol text frame."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode() + RECORD_SEPARATOR
+
 
 class ConnectionManager:
     """Manages WebSocket connections and project groups.
@@ -161,6 +169,14 @@ class ConnectionManager:
     async def send_to_connection(self, connection_id: str, message: dict):
         """Send message to specific connection.
         
+        Updates connection activity timestamp on successful send.
+        """
+        await self.send_frame_to_connection(connection_id, encode_frame(message))
+    
+    async def send_frame_to_connection(self, connection_id: str, frame: str):
+        """Send an already encoded frame to specific connection.
+        
+        Broadcasts encode the frame once and reuse it for every connection.
         Updates connection activity timestamp on successful send.
         """
         if connection_id not in self.active_connections:
@@ -168,9 +184,7 @@ class ConnectionManager:
         
         try:
             websocket = self.active_connections[connection_id]
-            # SignalR protocol requires record separator (0x1E) after each message
-            message_json = json.dumps(message)
-            await websocket.send_text(message_json + '\x1E')
+            await websocket.send_text(frame)
             # Update activity timestamp on successful send
             async with self._lock:
                 if connection_id in self.connection_activity:
@@ -184,6 +198,20 @@ class ConnectionManager:
         
         Optimized to send messages in parallel for better performance.
         """
+        await self.broadcast_frame_to_project(project_id, encode_frame(message), exclude_connection)
+    
+    async def broadcast_batch_to_project(self, project_id: str, messages: list, exclude_connection: Optional[str] = None):
+        """Broadcast several messages to a project group in a single frame.
+        
+        The SignalR JSON protocol allows multiple separator-terminated records per
+        frame, so each connection gets one send instead of one per message.
+        """
+        if messages:
+            frame = "".join(encode_frame(message) for message in messages)
+            await self.broadcast_frame_to_project(project_id, frame, exclude_connection)
+    
+    async def broadcast_frame_to_project(self, project_id: str, frame: str, exclude_connection: Optional[str] = None):
+        """Send an already encoded frame to all connections in a project group in parallel."""
         if project_id not in self.project_groups:
             return
         
@@ -197,8 +225,8 @@ class ConnectionManager:
         if not connection_ids:
             return
         
-        # Send messages in parallel
-        tasks = [self.send_to_connection(conn_id, message) for conn_id in connection_ids]
+        # Send the same frame to every connection in parallel
+        tasks = [self.send_frame_to_connection(conn_id, frame) for conn_id in connection_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Clean up failed connections
@@ -261,8 +289,9 @@ class ConnectionManager:
         if not connection_ids:
             return
         
-        # Send messages in parallel
-        tasks = [self.send_to_connection(conn_id, message) for conn_id in connection_ids]
+        frame = encode_frame(message)
+        # Send the same frame to every connection in parallel
+        tasks = [self.send_frame_to_connection(conn_id, frame) for conn_id in connection_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Clean up failed connections
@@ -12,6 +12,9 @@ from .signalr import (
     handle_message,
     broadcast_todo_update,
     broadcast_feature_update,
+    broadcast_batch,
+    todo_updated_message,
+    feature_updated_message,
     broadcast_project_update,
     broadcast_session_start,
     broadcast_session_end,
@@ -25,6 +28,9 @@ __all__ = [
     "handle_message",
     "broadcast_todo_update",
     "broadcast_feature_update",
+    "broadcast_batch",
+    "todo_updated_message",
+    "feature_updated_message",
     "broadcast_project_update",
     "broadcast_session_start",
     "broadcast_session_end",
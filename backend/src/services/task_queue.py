@@ -46,6 +46,7 @@ class TaskQueue:
     QUEUE_PREFIX = "task_queue:"
     TASK_PREFIX = "task:"
     RESULT_PREFIX = "task_result:"
+    META_PREFIX = "task_meta:"
     DEFAULT_TTL = 86400  # 24 hours
     
     def __init__(self):
@@ -93,6 +94,7 @@ class TaskQueue:
             self.DEFAULT_TTL,
             json.dumps(task)
         )
+        self._store_task_meta(task_id, task["status"], task_data.get("user_id"))
         
         # Add to queue (sorted by priority, then creation time)
         queue_key = f"{self.QUEUE_PREFIX}{task_type}"
@@ -119,6 +121,47 @@ class TaskQueue:
             return json.loads(task_data)
         return None
     
+    def _store_task_meta(self, task_id: str, status: str, user_id: Optional[Any] = None) -> None:
+        """Store the small status/owner record used by get_task_meta.
+        
+        Args:
+            task_id: Task ID
+            status: Task status value
+            user_id: Owner user ID (only set on enqueue)
+        """
+        meta_key = f"{self.META_PREFIX}{task_id}"
+        mapping = {"status": status}
+        if user_id is not None:
+            mapping["user_id"] = str(user_id)
+        pipe = self.redis.pipeline()
+        pipe.hset(meta_key, mapping=mapping)
+        pipe.expire(meta_key, self.DEFAULT_TTL)
+        pipe.execute()
+    
+    def get_task_meta(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get only the status and owner of a task.
+        
+        Reads two hash fields instead of the full task payload, for cheap
+        access checks before the task itself is fetched.
+        
+        Args:
+            task_id: Task ID
+            
+        Returns:
+            Dictionary with "status" and "user_id" or None if not found
+        """
+        status, user_id = self.redis.hmget(f"{self.META_PREFIX}{task_id}", "status", "user_id")
+        if status is None:
+            # Tasks enqueued before metadata was stored separately
+            task = self.get_task(task_id)
+            if not task:
+                return None
+            return {
+                "status": task.get("status"),
+                "user_id": task.get("data", {}).get("user_id"),
+            }
+        return {"status": status, "user_id": user_id}
+    
     def update_task_status(
         self,
         task_id: str,
@@ -168,6 +211,7 @@ class TaskQueue:
             self.DEFAULT_TTL,
             json.dumps(task)
         )
+        self._store_task_meta(task_id, task["status"])
         
         return True
     
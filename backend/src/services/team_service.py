@@ -1,9 +1,56 @@
 """Team service."""
+import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from src.database.models import Team, TeamMember, User
+from sqlalchemy import and_, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from src.database.models import Project, Team, TeamMember, User
+from src.services.cache_service import CacheService, CacheTTL
+from src.services.auth_cache import invalidate_user_auth
+from src.utils.request_cache import get_or_compute, clear_request_cache
+
+# Cache key for the total team count shown to admins (all teams)
+ADMIN_TEAMS_TOTAL_CACHE_KEY = "teams:total:admin"
+
+# In-process cache for get_team_by_id: team_id -> (expires_at, TeamSnapshot).
+# Team metadata changes rarely; writes in this process invalidate immediately,
+# other workers see changes within the TTL.
+TEAM_CACHE_TTL = 30  # seconds
+TEAM_CACHE_MAXSIZE = 10_000
+_team_cache: dict[UUID, tuple[float, "TeamSnapshot"]] = {}
+
+
+@dataclass(frozen=True)
+class TeamSnapshot:
+    """Read-only copy of a team's columns, safe to share across sessions."""
+    id: UUID
+    name: str
+    description: Optional[str]
+    language: Optional[str]
+    created_by: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_team(cls, team: Team) -> "TeamSnapshot":
+        return cls(
+            id=team.id,
+            name=team.name,
+            description=team.description,
+            language=team.language,
+            created_by=team.created_by,
+            created_at=team.created_at,
+            updated_at=team.updated_at,
+        )
+
+
+def invalidate_team_cache(team_id: UUID) -> None:
+    """Drop a team from the in-process get_team_by_id cache."""
+    _team_cache.pop(team_id, None)
 
 
 class TeamService:
@@ -40,12 +87,60 @@ class TeamService:
         db.add(team_member)
         db.commit()
         db.refresh(team)
+        CacheService.delete_cache(ADMIN_TEAMS_TOTAL_CACHE_KEY)
         return team
 
     @staticmethod
-    def get_team_by_id(db: Session, team_id: UUID) -> Optional[Team]:
-        """Get team by ID."""
-        return db.query(Team).filter(Team.id == team_id).first()
+    def get_team_by_id(db: Session, team_id: UUID) -> Optional[TeamSnapshot]:
+        """Get team by ID.
+
+        Returns a frozen TeamSnapshot (not an ORM object) from a short-lived
+        in-process cache. Use a query on Team directly when the row needs to be
+        modified.
+        """
+        now = time.monotonic()
+        entry = _team_cache.get(team_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        team = db.query(Team).filter(Team.id == team_id).first()
+        if team is None:
+            _team_cache.pop(team_id, None)
+            return None
+
+        snapshot = TeamSnapshot.from_team(team)
+        if len(_team_cache) >= TEAM_CACHE_MAXSIZE:
+            _team_cache.clear()
+        _team_cache[team_id] = (now + TEAM_CACHE_TTL, snapshot)
+        return snapshot
+
+    @staticmethod
+    def get_team_with_membership(
+        db: Session,
+        team_id: UUID,
+        user_id: UUID,
+    ) -> Tuple[Optional[Team], Optional[TeamMember], Optional[User]]:
+        """Get a team together with the user's membership row and user record.
+
+        One statement instead of get_team_by_id + is_team_member/is_team_leader +
+        a user lookup. The membership is None if the user is not in the team.
+
+        Returns:
+            (team, membership, user) - all None if the team does not exist
+        """
+        stmt = (
+            select(Team, TeamMember, User)
+            .outerjoin(
+                TeamMember,
+                and_(TeamMember.team_id == Team.id, TeamMember.user_id == user_id),
+            )
+            .outerjoin(User, User.id == user_id)
+            .where(Team.id == team_id)
+        )
+        row = db.execute(stmt).first()
+        if row is None:
+            return None, None, None
+        return row[0], row[1], row[2]
 
     @staticmethod
     def list_teams(
@@ -53,21 +148,57 @@ class TeamService:
         user_id: Optional[UUID] = None,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> tuple[List[Team], int]:
-        """List teams. If user_id provided, only return teams where user is a member."""
+        """List teams. If user_id provided, only return teams where user is a member.
+
+        Teams are ordered newest first by (created_at, id). Pass after=(created_at, id)
+        of the last team of the previous page for keyset pagination (skip is then
+        ignored); otherwise skip/limit OFFSET pagination is used. Callers that need
+        to know whether another page exists ask for one row more than they show.
+
+        In OFFSET mode the total comes from COUNT(*) OVER () on the page query
+        itself, so one round trip returns both. The admin total is cached briefly
+        because the number of teams rarely changes; create_team/delete_team
+        invalidate it.
+        """
+        total = None
         if user_id:
             # Get teams where user is a member
-            query = (
-                db.query(Team)
-                .join(TeamMember)
-                .filter(TeamMember.user_id == user_id)
+            stmt = (
+                select(Team)
+                .join(TeamMember, TeamMember.team_id == Team.id)
+                .where(TeamMember.user_id == user_id)
             )
+            count_stmt = select(func.count(TeamMember.id)).where(TeamMember.user_id == user_id)
         else:
             # Get all teams
-            query = db.query(Team)
+            stmt = select(Team)
+            count_stmt = select(func.count(Team.id))
+            total = CacheService.get_cache(ADMIN_TEAMS_TOTAL_CACHE_KEY)
 
-        total = query.count()
-        teams = query.order_by(Team.created_at.desc()).offset(skip).limit(limit).all()
+        stmt = stmt.order_by(Team.created_at.desc(), Team.id.desc()).limit(limit)
+        if after is not None:
+            # The window count would only cover rows after the cursor, so count separately
+            stmt = stmt.where(tuple_(Team.created_at, Team.id) < after)
+            teams = list(db.scalars(stmt).all())
+            if total is None:
+                total = db.scalar(count_stmt)
+        else:
+            stmt = stmt.offset(skip)
+            if total is not None:
+                return list(db.scalars(stmt).all()), total
+
+            rows = db.execute(stmt.add_columns(func.count().over().label("total"))).all()
+            teams = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                # Window total is unavailable on an empty page; only count past the end
+                total = db.scalar(count_stmt) if skip else 0
+
+        if not user_id:
+            CacheService.set_cache(ADMIN_TEAMS_TOTAL_CACHE_KEY, total, ttl=CacheTTL.VERY_SHORT)
         return teams, total
 
     @staticmethod
@@ -94,6 +225,7 @@ class TeamService:
 
         db.commit()
         db.refresh(team)
+        invalidate_team_cache(team_id)
         return team
 
     @staticmethod
@@ -105,6 +237,9 @@ class TeamService:
 
         db.delete(team)  # Cascade will delete team members
         db.commit()
+        invalidate_team_cache(team_id)
+        clear_request_cache()
+        CacheService.delete_cache(ADMIN_TEAMS_TOTAL_CACHE_KEY)
         return True
 
     @staticmethod
@@ -114,38 +249,38 @@ class TeamService:
         user_id: UUID,
         role: str = "member",
     ) -> TeamMember:
-        """Add a member to a team."""
-        # Verify team exists
-        team = db.query(Team).filter(Team.id == team_id).first()
-        if not team:
-            raise ValueError(f"Team {team_id} not found")
-
-        # Verify user exists
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise ValueError(f"User {user_id} not found")
-
-        # Check if user is already a member
-        existing = (
-            db.query(TeamMember)
-            .filter(TeamMember.team_id == team_id, TeamMember.user_id == user_id)
-            .first()
-        )
-        if existing:
-            raise ValueError(f"User {user_id} is already a member of team {team_id}")
+        """Add a member to a team.
 
+        Uses a single INSERT ... ON CONFLICT DO NOTHING RETURNING: the
+        (team_id, user_id) unique constraint detects existing members and the
+        foreign keys verify that the team and user exist.
+        """
         # Validate role
         if role not in ["team_leader", "member"]:
             raise ValueError(f"Invalid role: {role}. Must be 'team_leader' or 'member'")
 
-        team_member = TeamMember(
-            team_id=team_id,
-            user_id=user_id,
-            role=role,
+        stmt = (
+            pg_insert(TeamMember)
+            .values(team_id=team_id, user_id=user_id, role=role)
+            .on_conflict_do_nothing(index_elements=["team_id", "user_id"])
+            .returning(TeamMember)
         )
-        db.add(team_member)
+        try:
+            # Savepoint, so a failed insert doesn't roll back the caller's transaction
+            with db.begin_nested():
+                team_member = db.scalars(stmt).first()
+        except IntegrityError:
+            # Foreign key violation - work out which side is missing (rare path)
+            if not db.query(Team.id).filter(Team.id == team_id).first():
+                raise ValueError(f"Team {team_id} not found")
+            raise ValueError(f"User {user_id} not found")
+
+        if team_member is None:
+            raise ValueError(f"User {user_id} is already a member of team {team_id}")
+
         db.commit()
-        db.refresh(team_member)
+        clear_request_cache()
+        CacheService.invalidate_user_cache(str(user_id))
         return team_member
 
     @staticmethod
@@ -176,6 +311,8 @@ class TeamService:
             # Admins can be removed from teams (they don't need team membership)
             db.delete(team_member)
             db.commit()
+            clear_request_cache()
+            CacheService.invalidate_user_cache(str(user_id))
             return True
         
         # For non-admin users, check if this is their last team
@@ -194,6 +331,9 @@ class TeamService:
             db.delete(team_member)  # Delete team membership first
             db.delete(user)  # Delete user
             db.commit()
+            clear_request_cache()
+            CacheService.invalidate_user_cache(str(user_id))
+            invalidate_user_auth(user_id)
             return True
         
         # If not admin removing or user has other teams, check normal rules
@@ -205,6 +345,8 @@ class TeamService:
 
         db.delete(team_member)
         db.commit()
+        clear_request_cache()
+        CacheService.invalidate_user_cache(str(user_id))
         return True
 
     @staticmethod
@@ -228,48 +370,58 @@ class TeamService:
 
         team_member.role = role
         db.commit()
+        clear_request_cache()
+        CacheService.invalidate_user_cache(str(user_id))
         db.refresh(team_member)
         return team_member
 
-    @staticmethod
-    def get_team_members(
-        db: Session,
-        team_id: UUID,
-    ) -> List[TeamMember]:
-        """Get all members of a team."""
-        return (
-            db.query(TeamMember)
-            .filter(TeamMember.team_id == team_id)
-            .order_by(TeamMember.joined_at.asc())
-            .all()
-        )
-    
     @staticmethod
     def get_team_members_with_users(
         db: Session,
         team_id: UUID,
         skip: int = 0,
         limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> Tuple[List[Tuple[TeamMember, "User"]], int]:
-        """Get all members of a team with user information, with pagination."""
-        from src.database.models import User
-        
-        # Base query
+        """Get all members of a team with user information, with pagination.
+
+        Members are ordered by (joined_at, id). Pass after=(joined_at, id) of the
+        last member of the previous page for keyset pagination (skip is then
+        ignored).
+
+        In OFFSET mode the total is taken from COUNT(*) OVER () on the page query,
+        so rows and total come back in one round trip.
+        """
         query = (
             db.query(TeamMember, User)
             .join(User, TeamMember.user_id == User.id)
             .filter(TeamMember.team_id == team_id)
-            .order_by(TeamMember.joined_at.asc())
+            .order_by(TeamMember.joined_at.asc(), TeamMember.id.asc())
         )
-        
-        # Get total count
-        total = query.count()
-        
+        count_query = db.query(func.count(TeamMember.id)).filter(TeamMember.team_id == team_id)
+
+        if after is not None:
+            # The window count would only cover rows after the cursor, so count separately
+            query = query.filter(tuple_(TeamMember.joined_at, TeamMember.id) > after)
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all(), count_query.scalar()
+
+        query = query.add_columns(func.count().over().label("total"))
+
         # Apply pagination
         if limit is not None:
             query = query.offset(skip).limit(limit)
         
-        members = query.all()
+        rows = query.all()
+        members = [(member, user) for member, user, _ in rows]
+        if rows:
+            total = rows[0].total
+        elif skip and limit is not None:
+            # Window total is unavailable on an empty page; only count past the end
+            total = count_query.scalar()
+        else:
+            total = 0
         return members, total
 
     @staticmethod
@@ -278,17 +430,25 @@ class TeamService:
         team_id: UUID,
         user_id: UUID,
     ) -> bool:
-        """Check if user is a team leader of the team."""
-        team_member = (
-            db.query(TeamMember)
-            .filter(
-                TeamMember.team_id == team_id,
-                TeamMember.user_id == user_id,
-                TeamMember.role == "team_leader",
+        """Check if user is a team leader of the team.
+
+        Memoized for the duration of the current HTTP request (see
+        src/utils/request_cache.py), so auth dependencies and endpoint bodies
+        can both ask without a second round trip.
+        """
+        def compute() -> bool:
+            team_member = (
+                db.query(TeamMember.id)
+                .filter(
+                    TeamMember.team_id == team_id,
+                    TeamMember.user_id == user_id,
+                    TeamMember.role == "team_leader",
+                )
+                .first()
             )
-            .first()
-        )
-        return team_member is not None
+            return team_member is not None
+
+        return get_or_compute(("team_leader", str(team_id), str(user_id)), compute)
 
     @staticmethod
     def is_team_member(
@@ -296,13 +456,16 @@ class TeamService:
         team_id: UUID,
         user_id: UUID,
     ) -> bool:
-        """Check if user is a member of the team (any role)."""
-        team_member = (
-            db.query(TeamMember)
-            .filter(TeamMember.team_id == team_id, TeamMember.user_id == user_id)
-            .first()
-        )
-        return team_member is not None
+        """Check if user is a member of the team (any role). Memoized per request."""
+        def compute() -> bool:
+            team_member = (
+                db.query(TeamMember.id)
+                .filter(TeamMember.team_id == team_id, TeamMember.user_id == user_id)
+                .first()
+            )
+            return team_member is not None
+
+        return get_or_compute(("team_member", str(team_id), str(user_id)), compute)
 
     @staticmethod
     def has_team_membership(
@@ -356,15 +519,13 @@ class TeamService:
         team.language = language
         db.commit()
         db.refresh(team)
+        invalidate_team_cache(team_id)
         
         # Invalidate cache for all projects in this team
         # This ensures that rules generation will use the new language
-        from src.mcp.services.cache import cache_service
-        from src.database.models import Project
-        
-        projects = db.query(Project).filter(Project.team_id == team_id).all()
-        for project in projects:
+        project_ids = db.scalars(select(Project.id).where(Project.team_id == team_id)).all()
+        for project_id in project_ids:
             # Clear project context cache
-            cache_service.clear_pattern(f"project:{project.id}:*")
+            CacheService.clear_pattern(f"project:{project_id}:*")
         
         return team
@@ -1,17 +1,32 @@
 """Todo service."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import and_, or_, func, case, update, select, bindparam, tuple_
 from src.database.models import Todo, ProjectElement, Feature
 from src.database.base import set_current_user_id, reset_current_user_id
+from src.services.cache_service import CacheService
 from src.services.project_service import ProjectService
 
+# Hot single-row lookups, built once so every call reuses the cached compiled statement
+_TODO_BY_ID = select(Todo).where(Todo.id == bindparam("todo_id"))
+# Any other relationship access raises instead of silently issuing a lazy SELECT
+_TODO_WITH_ELEMENT = _TODO_BY_ID.options(joinedload(Todo.element), raiseload("*"))
+_ELEMENT_PROJECT_ID = select(ProjectElement.project_id).where(ProjectElement.id == bindparam("element_id"))
+
 
 class TodoService:
     """Service for todo operations."""
 
+    @staticmethod
+    def _invalidate_cache(db: Session, todo_id: UUID, element_id: Optional[UUID]) -> None:
+        """Drop the cached todo and its project's cached responses after a write."""
+        project_id = None
+        if element_id:
+            project_id = db.execute(_ELEMENT_PROJECT_ID, {"element_id": element_id}).scalar_one_or_none()
+        CacheService.invalidate_todo_cache(str(todo_id), str(project_id) if project_id else None)
+
     @staticmethod
     def create_todo(
         db: Session,
@@ -78,6 +93,7 @@ class TodoService:
             db.add(todo)
             db.commit()
             db.refresh(todo)
+            TodoService._invalidate_cache(db, todo.id, element_id)
 
             # Update element status based on todos
             from src.services.element_service import element_service
@@ -99,7 +115,31 @@ class TodoService:
     @staticmethod
     def get_todo_by_id(db: Session, todo_id: UUID) -> Optional[Todo]:
         """Get todo by ID."""
-        return db.query(Todo).filter(Todo.id == todo_id).first()
+        return db.execute(_TODO_BY_ID, {"todo_id": todo_id}).scalar_one_or_none()
+
+    @staticmethod
+    def get_todo_with_element(db: Session, todo_id: UUID) -> Optional[Todo]:
+        """Get todo by ID with its element eagerly loaded (for project access checks)."""
+        return db.execute(_TODO_WITH_ELEMENT, {"todo_id": todo_id}).scalar_one_or_none()
+
+    @staticmethod
+    def _page_with_total(query, skip: int, limit: int) -> tuple[List[Todo], int]:
+        """Fetch one page of a todo query together with the unpaginated total.
+
+        The total comes from a COUNT(*) OVER() window on the same SELECT, so data and
+        count take a single round-trip. List queries use raiseload("*"): todos are
+        serialized by column only, so a relationship access would be a per-row N+1.
+        """
+        rows = query.add_columns(func.count().over().label("total")).offset(skip).limit(limit).all()
+        todos = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Window total is unavailable on an empty page; only count past the end
+            total = query.order_by(None).count()
+        else:
+            total = 0
+        return todos, total
 
     @staticmethod
     def get_todos_by_element(
@@ -110,15 +150,63 @@ class TodoService:
         limit: int = 100,
     ) -> tuple[List[Todo], int]:
         """Get todos for an element."""
-        query = db.query(Todo).filter(Todo.element_id == element_id)
+        query = db.query(Todo).options(raiseload("*")).filter(Todo.element_id == element_id)
 
         if status:
             query = query.filter(Todo.status == status)
 
-        total = query.count()
-        todos = query.order_by(Todo.position, Todo.created_at).offset(skip).limit(limit).all()
+        query = query.order_by(Todo.position, Todo.created_at)
+        return TodoService._page_with_total(query, skip, limit)
 
-        return todos, total
+    @staticmethod
+    def get_todos_by_feature(
+        db: Session,
+        feature_id: UUID,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[List[Todo], int]:
+        """Get todos linked to a feature."""
+        query = db.query(Todo).options(raiseload("*")).filter(Todo.feature_id == feature_id)
+
+        if status:
+            query = query.filter(Todo.status == status)
+
+        query = query.order_by(Todo.position, Todo.created_at)
+        return TodoService._page_with_total(query, skip, limit)
+
+    @staticmethod
+    def get_todos_by_user(
+        db: Session,
+        user_id: UUID,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> tuple[List[Todo], int]:
+        """Get todos assigned to a user, newest first by (created_at, id).
+
+        Pass after=(created_at, id) of the last todo of the previous page for keyset
+        pagination (skip is then ignored); otherwise skip/limit OFFSET pagination is used.
+        """
+        query = db.query(Todo).options(raiseload("*")).filter(Todo.assigned_to == user_id)
+
+        if status:
+            query = query.filter(Todo.status == status)
+
+        if after is not None:
+            # The window count would only cover rows after the cursor, so count separately
+            total = query.count()
+            todos = (
+                query.filter(tuple_(Todo.created_at, Todo.id) < after)
+                .order_by(Todo.created_at.desc(), Todo.id.desc())
+                .limit(limit)
+                .all()
+            )
+            return todos, total
+
+        query = query.order_by(Todo.created_at.desc(), Todo.id.desc())
+        return TodoService._page_with_total(query, skip, limit)
 
     @staticmethod
     def get_todos_by_project(
@@ -127,20 +215,29 @@ class TodoService:
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        feature_id: Optional[UUID] = None,
+        element_id: Optional[UUID] = None,
+        assigned_to: Optional[UUID] = None,
     ) -> tuple[List[Todo], int]:
-        """Get todos for a project."""
+        """Get todos for a project, optionally narrowed by feature, element or assignee."""
         from sqlalchemy import case
         
         query = (
             db.query(Todo)
+            .options(raiseload("*"))
             .join(ProjectElement)
             .filter(ProjectElement.project_id == project_id)
         )
 
         if status:
             query = query.filter(Todo.status == status)
+        if feature_id:
+            query = query.filter(Todo.feature_id == feature_id)
+        if element_id:
+            query = query.filter(Todo.element_id == element_id)
+        if assigned_to:
+            query = query.filter(Todo.assigned_to == assigned_to)
 
-        total = query.count()
         # Order by status priority (new, in_progress first, then done), then by position and created_at
         status_priority = case(
             (Todo.status == 'new', 0),
@@ -148,13 +245,12 @@ class TodoService:
             (Todo.status == 'done', 2),
             else_=3
         )
-        todos = query.order_by(
+        query = query.order_by(
             status_priority,
             Todo.position,
             Todo.created_at
-        ).offset(skip).limit(limit).all()
-
-        return todos, total
+        )
+        return TodoService._page_with_total(query, skip, limit)
 
     @staticmethod
     def update_todo(
@@ -170,15 +266,21 @@ class TodoService:
         feature_id: Optional[UUID] = None,
         expected_version: Optional[int] = None,
         current_user_id: Optional[UUID] = None,
+        todo: Optional[Todo] = None,
     ) -> Optional[Todo]:
-        """Update todo with optimistic locking."""
+        """Update todo with optimistic locking.
+
+        Pass todo when the caller has already loaded it in this session (e.g. for
+        an access check) to skip fetching it again.
+        """
         # Set current user ID for audit trail
         token = None
         if current_user_id:
             token = set_current_user_id(current_user_id)
         
         try:
-            todo = db.query(Todo).filter(Todo.id == todo_id).first()
+            if todo is None:
+                todo = db.query(Todo).filter(Todo.id == todo_id).first()
             if not todo:
                 return None
 
@@ -228,6 +330,7 @@ class TodoService:
 
             db.commit()
             db.refresh(todo)
+            TodoService._invalidate_cache(db, todo.id, todo.element_id)
 
             # Update element status based on todos
             from src.services.element_service import element_service
@@ -255,6 +358,48 @@ class TodoService:
             if token:
                 reset_current_user_id(token)
 
+    @staticmethod
+    def _update_returning(
+        db: Session,
+        todo_id: UUID,
+        values: dict,
+        expected_version: Optional[int] = None,
+        current_user_id: Optional[UUID] = None,
+    ) -> Optional[Todo]:
+        """Apply a version-checked UPDATE ... RETURNING and commit it.
+
+        The version check happens in the WHERE clause, so it is atomic and the updated
+        row comes back without a separate read. Only when no row matched is a follow-up
+        query issued, to tell a missing todo (None) from a stale version (ValueError);
+        nothing was written, so no rollback is needed.
+        The returned todo is detached so the commit doesn't expire the values RETURNING
+        just loaded.
+        """
+        conditions = [Todo.id == todo_id]
+        if expected_version is not None:
+            conditions.append(Todo.version == expected_version)
+        if current_user_id:
+            # Core UPDATE bypasses the before_flush audit listener
+            values = {**values, "updated_by": current_user_id}
+
+        stmt = (
+            update(Todo)
+            .where(*conditions)
+            .values(**values, version=Todo.version + 1)
+            .returning(Todo)
+            .execution_options(populate_existing=True)
+        )
+        todo = db.execute(stmt).scalar_one_or_none()
+        if todo is None:
+            if db.query(Todo.id).filter(Todo.id == todo_id).first() is None:
+                return None
+            raise ValueError("Todo was modified by another user. Please refresh and try again.")
+
+        db.expunge(todo)
+        db.commit()
+        TodoService._invalidate_cache(db, todo.id, todo.element_id)
+        return todo
+
     @staticmethod
     def update_todo_status(
         db: Session,
@@ -263,11 +408,63 @@ class TodoService:
         expected_version: Optional[int] = None,
         current_user_id: Optional[UUID] = None,
     ) -> Optional[Todo]:
-        """Update todo status with optimistic locking."""
-        return TodoService.update_todo(
+        """Update todo status with optimistic locking in a single UPDATE ... RETURNING."""
+        # Same completed_at rules as update_todo: set on entering done, kept once done
+        completed_at = case(
+            (Todo.status == "done", Todo.completed_at),
+            else_=datetime.utcnow() if status == "done" else None,
+        )
+        # Rollups run as the current user too, so they record updated_by
+        token = None
+        if current_user_id:
+            token = set_current_user_id(current_user_id)
+
+        try:
+            todo = TodoService._update_returning(
+                db=db,
+                todo_id=todo_id,
+                values={"status": status, "completed_at": completed_at},
+                expected_version=expected_version,
+                current_user_id=current_user_id,
+            )
+            if not todo:
+                return None
+
+            element_id, feature_id = todo.element_id, todo.feature_id
+
+            # Update element status based on todos
+            from src.services.element_service import element_service
+            element_service.update_element_status_by_todos(db=db, element_id=element_id)
+            
+            # Update parent element statuses recursively
+            element_service.update_parent_statuses(db=db, element_id=element_id)
+
+            # Update feature progress if linked
+            if feature_id:
+                from src.services.feature_service import feature_service
+                feature_service.calculate_feature_progress(db=db, feature_id=feature_id)
+
+            return todo
+        finally:
+            if token:
+                reset_current_user_id(token)
+
+    @staticmethod
+    def assign_todo(
+        db: Session,
+        todo_id: UUID,
+        assigned_to: UUID,
+        expected_version: Optional[int] = None,
+        current_user_id: Optional[UUID] = None,
+    ) -> Optional[Todo]:
+        """Assign todo to a user with optimistic locking in a single UPDATE ... RETURNING.
+
+        Assignment doesn't affect element status or feature progress, so no rollups run.
+        """
+        return TodoService._update_returning(
             db=db,
             todo_id=todo_id,
-            status=status,
+            values={"assigned_to": assigned_to},
             expected_version=expected_version,
             current_user_id=current_user_id,
         )
@@ -280,8 +477,10 @@ class TodoService:
             return False
 
         element_id = todo.element_id
+        feature_id = todo.feature_id
         db.delete(todo)
         db.commit()
+        TodoService._invalidate_cache(db, todo_id, element_id)
 
         # Update element status based on todos
         from src.services.element_service import element_service
@@ -290,6 +489,11 @@ class TodoService:
         # Update parent element statuses recursively
         element_service.update_parent_statuses(db=db, element_id=element_id)
 
+        # Update feature progress if it was linked
+        if feature_id:
+            from src.services.feature_service import feature_service
+            feature_service.calculate_feature_progress(db=db, feature_id=feature_id)
+
         return True
 
 
@@ -1,13 +1,36 @@
 """Comprehensive error logging and monitoring utilities."""
 import logging
+import time
 import traceback
 from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import Request
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second a timestamp was made in.
+# Replaced as a whole tuple, so concurrent callers at worst format the same second twice.
+_second_prefix: tuple[int, str] = (0, "")
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision and a trailing "Z".
+    
+    The date/time part is formatted once per second; only the milliseconds
+    are computed per call.
+    """
+    global _second_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, _UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _second_prefix = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000):03d}Z"
+
 
 def log_error(
     error: Exception,
@@ -26,7 +49,7 @@ def log_error(
     error_info = {
         "error_type": type(error).__name__,
         "error_message": str(error),
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
     }
     
     # Add request context if available
@@ -88,11 +111,15 @@ def log_http_error(
     else:
         level = logging.INFO
     
+    # Don't build the context payload for records that would be dropped
+    if not logger.isEnabledFor(level):
+        return
+    
     error_info = {
         "status_code": status_code,
         "message": message,
         "error_code": error_code,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
     }
     
     if request:
@@ -134,7 +161,7 @@ def log_database_error(
         "error_message": str(error),
         "operation": operation,
         "table": table,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
     }
     
     if context:
@@ -166,7 +193,7 @@ def log_external_api_error(
         "error_message": str(error),
         "endpoint": endpoint,
         "status_code": status_code,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
     }
     
     if context:
@@ -190,14 +217,14 @@ def log_performance_issue(
         threshold_seconds: Threshold for warning (default: 1.0s)
         context: Optional additional context
     """
-    if duration_seconds < threshold_seconds:
-        return  # Don't log if under threshold
+    if duration_seconds < threshold_seconds or not logger.isEnabledFor(logging.WARNING):
+        return  # Don't log if under threshold or warnings are filtered out
     
     error_info = {
         "operation": operation,
         "duration_seconds": duration_seconds,
         "threshold_seconds": threshold_seconds,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
     }
     
     if context:
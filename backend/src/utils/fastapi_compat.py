@@ -0,0 +1,37 @@
+"""Backports for the pinned FastAPI version.
+
+FastAPI before 0.118 re-runs inspect-based checks (is_coroutine_callable,
+is_gen_callable, is_async_gen_callable) for every dependency on every request.
+Dependency callables are fixed when routes are registered, so the answers never
+change; install_dependency_introspection_cache memoizes them per callable.
+"""
+import functools
+from typing import Any, Callable
+from fastapi.dependencies import utils as dependency_utils
+
+_INTROSPECTION_HELPERS = ("is_coroutine_callable", "is_gen_callable", "is_async_gen_callable")
+
+
+def _memoize_per_callable(helper: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    results: dict[Any, bool] = {}
+
+    @functools.wraps(helper)
+    def cached(call: Any) -> bool:
+        try:
+            return results[call]
+        except KeyError:
+            result = results[call] = helper(call)
+            return result
+        except TypeError:
+            # Unhashable callable instance: nothing to key on
+            return helper(call)
+
+    return cached
+
+
+def install_dependency_introspection_cache() -> None:
+    """Memoize FastAPI's per-request dependency introspection helpers (idempotent)."""
+    for name in _INTROSPECTION_HELPERS:
+        helper = getattr(dependency_utils, name, None)
+        if helper is not None and not hasattr(helper, "__wrapped__"):
+            setattr(dependency_utils, name, _memoize_per_callable(helper))
@@ -0,0 +1,38 @@
+"""Per-request memoization for repeated lookups (e.g. authorization checks).
+
+RequestCacheMiddleware stores a fresh dict in the ``request_cache`` context
+variable for every HTTP request, so entries die with the request and never
+need explicit expiry. Outside a request (MCP tools, background workers) the
+context variable is unset and lookups are simply computed every time.
+"""
+import contextvars
+from typing import Any, Callable, Hashable, Optional
+
+request_cache: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "request_cache", default=None
+)
+
+
+def get_or_compute(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return the cached value for key in the current request, computing it on a miss.
+
+    Args:
+        key: Hashable cache key (e.g. ("team_member", team_id, user_id))
+        compute: Zero-argument callable producing the value
+
+    Returns:
+        Cached or freshly computed value
+    """
+    cache = request_cache.get()
+    if cache is None:
+        return compute()
+    if key not in cache:
+        cache[key] = compute()
+    return cache[key]
+
+
+def clear_request_cache() -> None:
+    """Drop all memoized values for the current request (call after writes)."""
+    cache = request_cache.get()
+    if cache:
+        cache.clear()
@@ -0,0 +1,56 @@
+"""Unit tests for the admin user endpoints."""
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from src.api.controllers.admin_users import create_user
+from src.database.models import User
+from src.services.auth_cache import get_user_auth
+from src.services.auth_service import AuthService
+
+
+def _bearer(user: User) -> HTTPAuthorizationCredentials:
+    token = AuthService.create_access_token({"sub": str(user.id), "email": user.email})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestCreateUser:
+    """Test cases for the create-user endpoint."""
+
+    async def test_create_user_with_admin_token(self, db: Session, test_admin_user: User):
+        """Test an admin bearer token is accepted without an API key."""
+        # Load the role through the test session; the endpoint reads it from the cache
+        get_user_auth(test_admin_user.id, db)
+
+        result = await create_user(
+            email=test_admin_user.email,
+            password="secret",
+            name=None,
+            role="admin",
+            team_id=None,
+            api_key=None,
+            credentials=_bearer(test_admin_user),
+            db=db,
+        )
+
+        assert result["status"] == "exists"
+        assert result["user_id"] == str(test_admin_user.id)
+
+    async def test_create_user_rejects_non_admin_token(self, db: Session, test_user: User):
+        """Test a non-admin bearer token is refused."""
+        get_user_auth(test_user.id, db)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_user(
+                email=test_user.email,
+                password="secret",
+                name=None,
+                role="admin",
+                team_id=None,
+                api_key=None,
+                credentials=_bearer(test_user),
+                db=db,
+            )
+
+        assert exc_info.value.status_code == 401
@@ -0,0 +1,56 @@
+"""Unit tests for the request validation middleware."""
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.api.middleware import validation
+from src.api.middleware.validation import ValidationMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ValidationMiddleware)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    return TestClient(app)
+
+
+class TestValidationMiddleware:
+    """Test cases for ValidationMiddleware."""
+
+    def test_rejects_oversized_content_length(self, monkeypatch):
+        """Test a declared Content-Length over the limit is refused before the route runs."""
+        monkeypatch.setattr(validation, "MAX_REQUEST_SIZE", 16)
+
+        response = _client().post("/echo", content=b"x" * 32, headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 413
+
+    def test_rejects_oversized_chunked_body(self, monkeypatch):
+        """Test a chunked body with no Content-Length is cut off once it passes the limit."""
+        monkeypatch.setattr(validation, "MAX_REQUEST_SIZE", 16)
+
+        def chunks():
+            for _ in range(4):
+                yield b"x" * 8
+
+        response = _client().post("/echo", content=chunks(), headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 413
+
+    def test_accepts_body_within_limit(self, monkeypatch):
+        """Test a body under the limit reaches the route."""
+        monkeypatch.setattr(validation, "MAX_REQUEST_SIZE", 16)
+
+        response = _client().post("/echo", content=b"{}", headers={"Content-Type": "application/json"})
+
+        assert response.status_code == 200
+        assert response.json() == {"size": 2}
+
+    def test_rejects_unsupported_content_type(self):
+        """Test a non-JSON body on a JSON endpoint gets 415."""
+        response = _client().post("/echo", content=b"a=1", headers={"Content-Type": "text/plain"})
+
+        assert response.status_code == 415
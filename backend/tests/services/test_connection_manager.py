@@ -0,0 +1,45 @@
+"""Unit tests for the SignalR ConnectionManager."""
+from uuid import uuid4
+
+from src.services.signalr.connection_manager import ConnectionManager, encode_frame
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in that records sent text frames."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, data: str):
+        self.sent.append(data)
+
+
+class TestConnectionManager:
+    """Test cases for ConnectionManager broadcasts."""
+
+    async def test_broadcast_to_all_sends_one_frame_per_connection(self):
+        """Test every connection except the excluded one receives the encoded frame."""
+        manager = ConnectionManager()
+        sockets = [FakeWebSocket() for _ in range(3)]
+        connection_ids = [await manager.connect(ws, uuid4()) for ws in sockets]
+        message = {"type": 1, "target": "userUpdated", "arguments": [{"id": "1"}]}
+
+        await manager.broadcast_to_all(message, exclude_connection=connection_ids[0])
+
+        assert sockets[0].sent == []
+        assert sockets[1].sent == [encode_frame(message)]
+        assert sockets[2].sent == [encode_frame(message)]
+
+    async def test_broadcast_to_team_without_projects_falls_back_to_all(self):
+        """Test a team with no registered projects broadcasts to every connection."""
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, uuid4())
+        message = {"type": 1, "target": "teamUpdated", "arguments": []}
+
+        await manager.broadcast_to_team(str(uuid4()), message)
+
+        assert ws.sent == [encode_frame(message)]
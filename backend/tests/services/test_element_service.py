@@ -0,0 +1,60 @@
+"""Unit tests for ElementService."""
+import pytest
+from sqlalchemy.orm import Session
+
+from src.services.element_service import ElementService
+from src.database.models import Project, ProjectElement, Todo
+
+
+class TestElementService:
+    """Test cases for ElementService."""
+
+    def test_build_element_tree_nests_children_with_stats(
+        self, db: Session, test_project: Project, test_element: ProjectElement, test_todo: Todo
+    ):
+        """Test the tree nests descendants under their parents with per-element stats."""
+        child = ProjectElement(
+            project_id=test_project.id,
+            parent_id=test_element.id,
+            type="component",
+            title="Child Element",
+            status="new",
+        )
+        db.add(child)
+        db.flush()
+        grandchild = ProjectElement(
+            project_id=test_project.id,
+            parent_id=child.id,
+            type="component",
+            title="Grandchild Element",
+            status="new",
+        )
+        db.add(grandchild)
+        db.flush()
+
+        tree = ElementService.build_element_tree(db, test_project.id)
+
+        assert [node["id"] for node in tree] == [str(test_element.id)]
+        root = tree[0]
+        assert root["todos_count"] == 1
+        assert [node["id"] for node in root["children"]] == [str(child.id)]
+        assert [node["id"] for node in root["children"][0]["children"]] == [str(grandchild.id)]
+        assert root["children"][0]["children"][0]["children"] == []
+
+    def test_build_element_tree_from_parent(
+        self, db: Session, test_project: Project, test_element: ProjectElement
+    ):
+        """Test building the subtree below a given parent."""
+        child = ProjectElement(
+            project_id=test_project.id,
+            parent_id=test_element.id,
+            type="component",
+            title="Child Element",
+            status="new",
+        )
+        db.add(child)
+        db.flush()
+
+        subtree = ElementService.build_element_tree(db, test_project.id, parent_id=test_element.id)
+
+        assert [node["id"] for node in subtree] == [str(child.id)]
@@ -4,7 +4,7 @@ from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 
 from src.services.feature_service import FeatureService
-from src.database.models import Feature, Project, Todo
+from src.database.models import Feature, Project, ProjectElement, Todo, User
 
 
 class TestFeatureService:
@@ -103,6 +103,23 @@ class TestFeatureService:
         assert test_feature.completed_todos == 1
         assert test_feature.progress_percentage == 50
     
+    def test_get_feature_with_progress(self, db: Session, test_feature: Feature, test_element: ProjectElement):
+        """Test reading a feature and its progress in one query."""
+        db.add_all([
+            Todo(element_id=test_element.id, feature_id=test_feature.id, title="Todo 1", status="done", version=1),
+            Todo(element_id=test_element.id, feature_id=test_feature.id, title="Todo 2", status="new", version=1),
+        ])
+        db.flush()
+
+        feature, percentage = FeatureService.get_feature_with_progress(db, test_feature.id)
+
+        assert feature.id == test_feature.id
+        assert percentage == 50
+
+        feature, percentage = FeatureService.get_feature_with_progress(db, uuid4())
+        assert feature is None
+        assert percentage == 0
+    
     def test_delete_feature(self, db: Session, test_feature: Feature):
         """Test deleting a feature."""
         feature_id = test_feature.id
@@ -0,0 +1,121 @@
+"""Unit tests for TeamService."""
+import pytest
+from uuid import uuid4
+from sqlalchemy.orm import Session
+
+from src.services.team_service import TeamService
+from src.database.models import Team, TeamMember, User
+from src.utils.request_cache import request_cache
+
+
+class TestTeamService:
+    """Test cases for TeamService."""
+
+    def test_add_member(self, db: Session, test_team: Team, test_user: User):
+        """Test adding a member to a team."""
+        team_member = TeamService.add_member(db, test_team.id, test_user.id, role="member")
+
+        assert team_member is not None
+        assert team_member.team_id == test_team.id
+        assert team_member.user_id == test_user.id
+        assert team_member.role == "member"
+        assert team_member.joined_at is not None
+
+    def test_add_member_already_member(self, db: Session, test_team: Team, test_user: User):
+        """Test adding a user who is already a member of the team."""
+        TeamService.add_member(db, test_team.id, test_user.id)
+
+        with pytest.raises(ValueError, match="already a member"):
+            TeamService.add_member(db, test_team.id, test_user.id)
+
+        count = db.query(TeamMember).filter(
+            TeamMember.team_id == test_team.id,
+            TeamMember.user_id == test_user.id,
+        ).count()
+        assert count == 1
+
+    def test_add_member_missing_user_keeps_transaction(self, db: Session, test_team: Team):
+        """Test a missing user raises ValueError without rolling back the caller's work."""
+        test_team.description = "Pending description"
+        db.flush()
+
+        with pytest.raises(ValueError, match="not found"):
+            TeamService.add_member(db, test_team.id, uuid4())
+
+        db.refresh(test_team)
+        assert test_team.description == "Pending description"
+
+    def test_add_member_invalid_role(self, db: Session, test_team: Team, test_user: User):
+        """Test adding a member with an invalid role."""
+        with pytest.raises(ValueError, match="Invalid role"):
+            TeamService.add_member(db, test_team.id, test_user.id, role="owner")
+
+    def test_list_teams_for_user(self, db: Session, test_team: Team, test_user: User):
+        """Test listing teams for a team member."""
+        TeamService.add_member(db, test_team.id, test_user.id)
+
+        teams, total = TeamService.list_teams(db, user_id=test_user.id)
+
+        assert total == 1
+        assert [team.id for team in teams] == [test_team.id]
+
+    def test_list_teams_for_non_member(self, db: Session, test_team: Team):
+        """Test listing teams for a user without memberships."""
+        teams, total = TeamService.list_teams(db, user_id=uuid4())
+
+        assert total == 0
+        assert teams == []
+
+    def test_is_team_member_cache_cleared_on_add(self, db: Session, test_team: Team, test_user: User):
+        """Test that membership checks memoized for a request see later membership writes."""
+        token = request_cache.set({})
+        try:
+            assert TeamService.is_team_member(db, test_team.id, test_user.id) is False
+            TeamService.add_member(db, test_team.id, test_user.id)
+            assert TeamService.is_team_member(db, test_team.id, test_user.id) is True
+        finally:
+            request_cache.reset(token)
+
+    def test_get_team_with_membership(self, db: Session, test_team: Team, test_user: User):
+        """Test fetching a team with the user's membership and user record."""
+        team, membership, user = TeamService.get_team_with_membership(db, test_team.id, test_user.id)
+        assert team.id == test_team.id
+        assert membership is None
+        assert user.id == test_user.id
+
+        TeamService.add_member(db, test_team.id, test_user.id, role="team_leader")
+        _, membership, _ = TeamService.get_team_with_membership(db, test_team.id, test_user.id)
+        assert membership.role == "team_leader"
+
+    def test_get_team_with_membership_missing_team(self, db: Session, test_user: User):
+        """Test fetching a team that does not exist."""
+        assert TeamService.get_team_with_membership(db, uuid4(), test_user.id) == (None, None, None)
+
+    def test_get_team_by_id_cache_invalidated_on_update(self, db: Session, test_team: Team):
+        """Test that cached team snapshots are refreshed after update_team."""
+        team = TeamService.get_team_by_id(db, test_team.id)
+        assert team.name == test_team.name
+
+        TeamService.update_team(db, test_team.id, name="Renamed Team")
+
+        assert TeamService.get_team_by_id(db, test_team.id).name == "Renamed Team"
+
+    def test_list_teams_keyset_pagination(self, db: Session, test_team: Team, test_user: User):
+        """Test paging through a user's teams with an (created_at, id) cursor."""
+        other_team = Team(name=f"Second Team {uuid4().hex[:8]}", created_by=test_user.id)
+        db.add(other_team)
+        db.flush()
+        TeamService.add_member(db, test_team.id, test_user.id)
+        TeamService.add_member(db, other_team.id, test_user.id)
+
+        # Ask for one row more than the page size, as the endpoint does
+        first_page, total = TeamService.list_teams(db, user_id=test_user.id, limit=2)
+        last = first_page[0]
+        second_page, _ = TeamService.list_teams(
+            db, user_id=test_user.id, limit=2, after=(last.created_at, last.id)
+        )
+
+        assert total == 2
+        assert len(first_page) == 2  # a next page exists
+        assert len(second_page) == 1  # the last page
+        assert {first_page[0].id, second_page[0].id} == {test_team.id, other_team.id}
@@ -1,10 +1,12 @@
 """Unit tests for TodoService."""
 import pytest
 from uuid import UUID, uuid4
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 
+from src.services.cache_service import CacheService
 from src.services.todo_service import TodoService
-from src.database.models import Todo, ProjectElement, Feature, Project
+from src.database.models import Todo, ProjectElement, Feature, Project, User
 
 
 class TestTodoService:
@@ -80,6 +82,63 @@ class TestTodoService:
         assert total >= 1
         assert any(t.id == test_todo.id for t in todos)
     
+    def test_get_todos_by_project_filters_in_query(self, db: Session, test_project: Project, test_element: ProjectElement, test_todo: Todo):
+        """Test feature/element filters are applied before pagination so totals stay correct."""
+        other = Todo(element_id=test_element.id, title="Unlinked Todo", status="new", version=1)
+        db.add(other)
+        db.flush()
+
+        todos, total = TodoService.get_todos_by_project(
+            db=db,
+            project_id=test_project.id,
+            feature_id=test_todo.feature_id,
+            limit=1,
+        )
+
+        assert total == 1
+        assert [t.id for t in todos] == [test_todo.id]
+    
+    def test_get_todos_by_user_keyset_pagination(self, db: Session, test_element: ProjectElement, test_user: User):
+        """Test assigned todos page by (created_at, id) cursor without gaps or repeats."""
+        for i in range(3):
+            db.add(Todo(element_id=test_element.id, title=f"Assigned {i}", status="new", assigned_to=test_user.id, version=1))
+        db.flush()
+
+        first, total = TodoService.get_todos_by_user(db, test_user.id, limit=2)
+        after = (first[-1].created_at, first[-1].id)
+        second, keyset_total = TodoService.get_todos_by_user(db, test_user.id, limit=2, after=after)
+
+        assert total == keyset_total == 3
+        assert len(first) == 2 and len(second) == 1
+        assert not {t.id for t in first} & {t.id for t in second}
+    
+    def test_get_todos_by_user_exact_last_page(self, db: Session, test_element: ProjectElement, test_user: User):
+        """Test a page-size + 1 fetch tells an exactly full last page apart from a next page."""
+        for i in range(4):
+            db.add(Todo(element_id=test_element.id, title=f"Assigned {i}", status="new", assigned_to=test_user.id, version=1))
+        db.flush()
+        page_size = 2
+
+        # Ask for one row more than the page size, as the endpoint does
+        first, _ = TodoService.get_todos_by_user(db, test_user.id, limit=page_size + 1)
+        last = first[page_size - 1]
+        second, _ = TodoService.get_todos_by_user(
+            db, test_user.id, limit=page_size + 1, after=(last.created_at, last.id)
+        )
+
+        assert len(first) == page_size + 1  # a next page exists
+        assert len(second) == page_size  # exactly full, and the last page
+        assert not {t.id for t in first[:page_size]} & {t.id for t in second}
+    
+    def test_get_todo_with_element_raises_on_lazy_load(self, db: Session, test_todo: Todo):
+        """Test the element is eagerly loaded and other relationships refuse lazy loads."""
+        db.expunge_all()
+        todo = TodoService.get_todo_with_element(db, test_todo.id)
+
+        assert todo.element.id == test_todo.element_id
+        with pytest.raises(InvalidRequestError):
+            todo.feature
+    
     def test_update_todo_status(self, db: Session, test_todo: Todo, test_user: User):
         """Test updating todo status."""
         updated = TodoService.update_todo_status(
@@ -94,6 +153,37 @@ class TestTodoService:
         assert updated.status == "in_progress"
         assert updated.version == test_todo.version + 1  # Version should increment
     
+    def test_update_todo_status_missing_todo_keeps_transaction(self, db: Session, test_todo: Todo):
+        """Test a missing todo returns None without rolling back the caller's pending work."""
+        test_todo.title = "Pending title"
+        db.flush()
+
+        updated = TodoService.update_todo_status(db=db, todo_id=uuid4(), status="done")
+
+        assert updated is None
+        db.refresh(test_todo)
+        assert test_todo.title == "Pending title"
+    
+    def test_update_todo_status_invalidates_cache(
+        self, db: Session, test_project: Project, test_todo: Todo, test_user: User, monkeypatch
+    ):
+        """Test the service clears the cached todo and project responses itself."""
+        invalidated = []
+        monkeypatch.setattr(
+            CacheService,
+            "invalidate_todo_cache",
+            staticmethod(lambda todo_id, project_id=None: invalidated.append((todo_id, project_id))),
+        )
+
+        TodoService.update_todo_status(
+            db=db,
+            todo_id=test_todo.id,
+            status="in_progress",
+            current_user_id=test_user.id,
+        )
+
+        assert invalidated == [(str(test_todo.id), str(test_project.id))]
+    
     def test_update_todo_status_optimistic_locking(self, db: Session, test_todo: Todo, test_user: User):
         """Test optimistic locking prevents concurrent updates."""
         # First update